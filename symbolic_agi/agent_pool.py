@@ -1,5 +1,6 @@
 # symbolic_agi/agent_pool.py
 
+import json
 import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, cast
@@ -24,6 +25,12 @@ class DynamicAgentPool:
         self.subagents: dict[str, dict[str, Any]] = {}
         self.bus: RedisMessageBus = bus
         self.skill_manager = skill_manager
+        # Agent names per persona, in insertion order, so lookups skip a pool scan
+        self._agents_by_persona: dict[str, list[str]] = {}
+        # Action definitions only change when skills or innate actions are added
+        self._actions_cache_key: tuple[int, int] | None = None
+        self._actions_cache: list[dict[str, Any]] = []
+        self._actions_json_cache: str = "[]"
         logging.info("[AgentPool] Initialized.")
 
     def add_agent(
@@ -44,6 +51,7 @@ class DynamicAgentPool:
                 "last_used_timestamp": datetime.now(timezone.utc).isoformat(),
             },
         }
+        self._agents_by_persona.setdefault(persona.lower(), []).append(name)
         self.bus.subscribe(name)
         metrics.AGENT_TRUST.labels(agent_name=name, persona=persona.lower()).set(
             config.INITIAL_TRUST_SCORE
@@ -104,34 +112,29 @@ class DynamicAgentPool:
 
     def get_agents_by_persona(self: "DynamicAgentPool", persona: str) -> list[str]:
         """Gets a list of agent names matching a specific persona."""
-        return [
-            agent["name"]
-            for agent in self.subagents.values()
-            if agent.get("persona") == persona
-        ]
+        return list(self._agents_by_persona.get(persona, ()))
 
     def get_all_personas(self) -> list[str]:
         """Returns a list of all unique, currently available persona names."""
-        personas: set[str] = {
-            agent.get("persona", "unknown") for agent in self.subagents.values()
-        }
-        return sorted(list(personas))
+        return sorted(self._agents_by_persona)
+
+    def _refresh_action_definitions(self) -> None:
+        """Rebuilds the cached action definitions if skills or innate actions changed."""
+        cache_key = (
+            self.skill_manager.revision,
+            len(self.skill_manager.innate_actions),
+        )
+        if cache_key == self._actions_cache_key:
+            return
 
-    def get_all_action_definitions(self) -> list[dict[str, Any]]:
-        """Gets a list of all available actions (innate and learned)."""
         all_actions = [
             action.model_dump() for action in self.skill_manager.innate_actions
         ]
 
-        # Add learned skills as orchestrator-level actions
-        latest_skills: dict[str, Any] = {}
-        for skill in self.skill_manager.skills.values():
-            # Only include the latest version of each skill
-            if (
-                skill.name not in latest_skills
-                or skill.version > latest_skills[skill.name].get("version", 0)
-            ):
-                latest_skills[skill.name] = {
+        # Add the latest version of each learned skill as an orchestrator-level action
+        for skill in self.skill_manager.skill_index.values():
+            all_actions.append(
+                {
                     "name": skill.name,
                     "description": skill.description,
                     "version": skill.version,
@@ -146,6 +149,18 @@ class DynamicAgentPool:
                     "assigned_persona": "orchestrator",
                     "type": "learned",
                 }
-        
-        all_actions.extend(latest_skills.values())
-        return all_actions
+            )
+
+        self._actions_cache = all_actions
+        self._actions_json_cache = json.dumps(all_actions, indent=2)
+        self._actions_cache_key = cache_key
+
+    def get_all_action_definitions(self) -> list[dict[str, Any]]:
+        """Gets a list of all available actions (innate and learned)."""
+        self._refresh_action_definitions()
+        return list(self._actions_cache)
+
+    def get_all_action_definitions_json(self) -> str:
+        """Gets all available actions as the indented JSON string used in prompts."""
+        self._refresh_action_definitions()
+        return self._actions_json_cache
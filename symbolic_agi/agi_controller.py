@@ -4,22 +4,22 @@ import asyncio
 import atexit
 import logging
 import os
+import shutil
 from collections import deque
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 from datetime import datetime, timezone
 
-from playwright.async_api import Browser, Page, async_playwright
-from watchfiles import awatch
-
 from . import config
 from .agent_pool import DynamicAgentPool
 from .api_client import client
+from .database import resolve_memory_db
 from .ethical_governance import SymbolicEvaluator  # Class not found
 from .execution_unit import ExecutionUnit
 from .long_term_memory import LongTermMemory
 from .message_bus import RedisMessageBus
 from .meta_cognition import MetaCognitionUnit
 from .micro_world import MicroWorld
+from .plan_cache import PlanCache
 from .planner import Planner
 from .recursive_introspector import RecursiveIntrospector
 from .schemas import (
@@ -36,6 +36,8 @@ from .symbolic_memory import SymbolicMemory
 from .tool_plugin import ToolPlugin
 
 if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
     from .consciousness import Consciousness
 
 
@@ -68,9 +70,10 @@ class SymbolicAGI:
     execution_history: Dict[str, List[Any]]
     orchestrator_actions: Dict[str, Callable[..., Any]]
     agent_tasks: List[asyncio.Task[None]]
+    _temp_db_dir: Optional[str]
 
-    browser: Optional[Browser] = None
-    page: Optional[Page] = None
+    browser: Optional["Browser"] = None
+    page: Optional["Page"] = None
 
     def __init__(
         self, cfg: Optional[AGIConfig] = None, world: Optional[MicroWorld] = None
@@ -97,10 +100,11 @@ class SymbolicAGI:
         
         # Runtime state
         self._perception_task = None
-        self.perception_buffer = deque(maxlen=100)
+        self.perception_buffer = deque(maxlen=config.PERCEPTION_BUFFER_SIZE)
         self.workspaces = {}
         self.execution_history = {}
         self.agent_tasks = []
+        self._temp_db_dir = None
 
         # Built-in orchestrator actions
         self.orchestrator_actions = {
@@ -115,6 +119,9 @@ class SymbolicAGI:
     async def create(cls, cfg: Optional[AGIConfig] = None, world: Optional[MicroWorld] = None, db_path: str = config.DB_PATH) -> "SymbolicAGI":
         """Asynchronously initialize the AGI and its components."""
         instance = cls(cfg, world)
+        # Every component opens its own connections, so a memory database would
+        # hand each one a separate empty database.
+        db_path, instance._temp_db_dir = resolve_memory_db(db_path)
         instance.memory = await SymbolicMemory.create(client, db_path=db_path)
         instance.identity = await SymbolicIdentity.create(instance.memory, db_path=db_path)
         instance.ltm = await LongTermMemory.create(db_path=db_path)
@@ -133,6 +140,7 @@ class SymbolicAGI:
             from .consciousness import Consciousness as ConsciousnessClass
             instance.consciousness = await ConsciousnessClass.create(db_path=db_path)
         
+        instance.execution_unit.plan_cache = await PlanCache.create(db_path=db_path)
         instance.meta_cognition = MetaCognitionUnit(instance)
         
         # Create essential agents automatically
@@ -159,6 +167,9 @@ class SymbolicAGI:
             logging.info(f"Auto-created essential agent: {agent_data['name']} ({agent_data['persona']})")
 
     async def start_background_tasks(self) -> None:
+        # Imported here so that loading the controller does not pull in Playwright
+        from playwright.async_api import async_playwright
+
         playwright = await async_playwright().start()
         self.browser = await playwright.chromium.launch(headless=True)
         logging.info("Playwright browser instance started.")
@@ -200,12 +211,19 @@ class SymbolicAGI:
             except Exception as e:
                 logging.debug("Browser already closed or error during close: %s", e)
 
+        if self.tools:
+            await self.tools.shutdown()
+
         if self.memory:
             await self.memory.shutdown()
 
         if self.message_bus:
             await self.message_bus.shutdown()
 
+        if self._temp_db_dir:
+            shutil.rmtree(self._temp_db_dir, ignore_errors=True)
+            self._temp_db_dir = None
+
         logging.info("Controller: Shutdown complete.")
 
     async def delegate_task_and_wait(
@@ -357,6 +375,8 @@ class SymbolicAGI:
         Uses watchfiles to efficiently monitor the workspace directory for changes.
         This is an event-driven approach, superior to polling.
         """
+        from watchfiles import awatch
+
         logging.info("Async workspace watchdog started.")
         workspace_path = os.path.abspath(self.tools.workspace_dir)
         try:
@@ -389,7 +409,7 @@ class SymbolicAGI:
                     "Found active goal '%s' with no plan. Decomposing now.", goal.description
                 )
                 planner_output = await self.planner.decompose_goal_into_plan(
-                    goal.description, ""
+                    goal.description
                 )
                 if planner_output.plan:
                     await self.ltm.update_plan(goal.id, planner_output.plan)
@@ -14,10 +14,12 @@ EMBEDDING_DIM = 1536
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 DB_PATH = os.path.join("data", "symbolic_agi.db")
+DB_BUSY_TIMEOUT_SECONDS = 5.0  # How long a connection waits on a locked database
 
 # --- File Paths ---
 MUTATION_FILE_PATH = "data/reasoning_mutations.json"
 WORKSPACE_DIR = "data/workspace"
+PRETTY_STATE_FILES = False  # Indent rewritten state files for debugging
 
 # --- Behavioral & Ethical Tuning ---
 PLAN_EVALUATION_THRESHOLD = 0.7
@@ -48,9 +50,35 @@ MEMORY_COMPRESSION_WINDOW = timedelta(days=1)
 SOCIAL_INTERACTION_THRESHOLD = timedelta(hours=6)
 MEMORY_FORGETTING_THRESHOLD = 0.2
 
+# --- Perception ---
+PERCEPTION_BUFFER_SIZE = 100  # Oldest perceptions are dropped beyond this
+
+# --- Skills ---
+# Skills in the DB are only written from validated models, so they are rebuilt
+# without re-validation on load. Disable if the DB may be edited externally.
+TRUST_SKILLS_DB = True
+
+# --- Plan Cache ---
+PLAN_CACHE_TTL = timedelta(days=7)
+PLAN_CACHE_MAX_ENTRIES = 256
+
+# --- Plan Evaluation Cache ---
+PLAN_EVALUATION_CACHE_TTL = timedelta(minutes=30)
+PLAN_EVALUATION_CACHE_MAX_ENTRIES = 512
+
+# --- Monitoring ---
+MONITORING_DASHBOARD_TTL_SECONDS = 10.0
+MONITORING_SLOW_STATS_TTL_SECONDS = 60.0
+MONITORING_HISTORY_SIZE = 256
+MONITORING_FLUSH_INTERVAL_SECONDS = 60.0
+
+# --- Robots.txt ---
+ROBOTS_DECISION_CACHE_MAX_ENTRIES = 4096
+
 import urllib.robotparser
 import urllib.parse
-from typing import Dict, Set, Optional
+from collections import OrderedDict
+from typing import Dict, Set, Optional, Tuple
 import asyncio
 import logging
 import time
@@ -62,6 +90,8 @@ class RobotsChecker:
         self._robots_cache: Dict[str, urllib.robotparser.RobotFileParser] = {}
         self._cache_timestamps: Dict[str, float] = {}
         self._cache_duration = 3600  # 1 hour cache
+        # (domain, path) -> (timestamp of the parser that decided, allowed), least recent first
+        self._decision_cache: "OrderedDict[Tuple[str, str], Tuple[float, bool]]" = OrderedDict()
         self._user_agent = "SymbolicAGI/1.0 (+https://github.com/yourproject/symbolic_agi)"
     
     async def can_fetch(self, url: str) -> bool:
@@ -69,6 +99,21 @@ class RobotsChecker:
         try:
             parsed_url = urllib.parse.urlparse(url)
             domain = parsed_url.netloc.lower()
+            path = parsed_url.path or "/"
+            if parsed_url.query:
+                path = f"{path}?{parsed_url.query}"
+            decision_key = (domain, path)
+
+            # Reuse an earlier decision while the parser that made it is still cached
+            cached = self._decision_cache.get(decision_key)
+            if cached is not None:
+                parser_timestamp, allowed = cached
+                if (
+                    self._cache_timestamps.get(domain) == parser_timestamp
+                    and time.time() - parser_timestamp < self._cache_duration
+                ):
+                    self._decision_cache.move_to_end(decision_key)
+                    return allowed
             
             # Get robots.txt for this domain
             robots_parser = await self._get_robots_parser(domain)
@@ -80,6 +125,10 @@ class RobotsChecker:
             
             # Check if we can fetch this URL
             can_fetch = robots_parser.can_fetch(self._user_agent, url)
+            self._decision_cache[decision_key] = (self._cache_timestamps[domain], can_fetch)
+            self._decision_cache.move_to_end(decision_key)
+            while len(self._decision_cache) > ROBOTS_DECISION_CACHE_MAX_ENTRIES:
+                self._decision_cache.popitem(last=False)
             
             logging.info(f"Robots.txt check for {url}: {'ALLOWED' if can_fetch else 'BLOCKED'}")
             return can_fetch
@@ -106,9 +155,11 @@ class RobotsChecker:
             # Use asyncio to run the blocking operation
             robots_parser = await asyncio.to_thread(self._fetch_robots_sync, robots_url)
             
-            # Cache the result
+            # Cache the result; decisions made by the replaced parser are stale
             self._robots_cache[domain] = robots_parser
             self._cache_timestamps[domain] = current_time
+            for key in [key for key in self._decision_cache if key[0] == domain]:
+                del self._decision_cache[key]
             
             return robots_parser
             
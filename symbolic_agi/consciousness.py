@@ -3,15 +3,14 @@
 import asyncio
 import json
 import logging
-import os
+import shutil
 from collections import deque
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
-import aiosqlite
-
 from . import config
 from .api_client import monitored_chat_completion
+from .database import connect_db, enable_wal, ensure_db_dir, resolve_memory_db
 from .schemas import LifeEvent
 
 if TYPE_CHECKING:
@@ -28,19 +27,24 @@ class Consciousness:
         self.life_story: Deque[LifeEvent] = deque(maxlen=200)
         self._is_dirty: bool = False
         self._save_lock = asyncio.Lock()
+        # Backing directory when a memory database was requested, removed on shutdown
+        self._temp_db_dir: Optional[str] = None
 
     @classmethod
     async def create(cls, db_path: str = config.DB_PATH) -> "Consciousness":
         """Asynchronous factory for creating a Consciousness instance."""
+        db_path, temp_db_dir = resolve_memory_db(db_path)
         instance = cls(db_path)
+        instance._temp_db_dir = temp_db_dir
         await instance._init_db()
         await instance._load_state()
         return instance
 
     async def _init_db(self) -> None:
         """Initializes the database and tables if they don't exist."""
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        async with aiosqlite.connect(self._db_path) as db:
+        ensure_db_dir(self._db_path)
+        async with connect_db(self._db_path) as db:
+            await enable_wal(db)
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS consciousness_drives (
@@ -63,7 +67,7 @@ class Consciousness:
 
     async def _load_state(self) -> None:
         """Loads drives and life story from the database."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with connect_db(self._db_path) as db:
             # Load drives
             async with db.execute("SELECT drive_name, value FROM consciousness_drives") as cursor:
                 rows = await cursor.fetchall()
@@ -95,7 +99,7 @@ class Consciousness:
             return
 
         async with self._save_lock:
-            async with aiosqlite.connect(self._db_path) as db:
+            async with connect_db(self._db_path) as db:
                 async with db.execute("BEGIN"):
                     # Save drives
                     await db.executemany(
@@ -132,6 +136,21 @@ class Consciousness:
         self._is_dirty = True
         return event
 
+    async def save_state_batch(
+        self, event_summaries: List[str], importance: float = 0.5
+    ) -> List[LifeEvent]:
+        """Adds several life events and persists them with a single state save."""
+        events = [
+            LifeEvent(summary=summary, importance=importance)
+            for summary in event_summaries
+        ]
+        if not events:
+            return events
+        self.life_story.extend(events)
+        self._is_dirty = True
+        await self._save_state()
+        return events
+
     async def get_narrative(self) -> str:
         """Constructs a narrative string from the most recent and important life events."""
         recent_events = list(self.life_story)[-20:]
@@ -227,8 +246,9 @@ your active drives, and what you want most right now.
         """Returns the name and value of the currently strongest drive."""
         if not self.drives:
             return "curiosity", 0.5
-        strongest = max(self.drives.items(), key=lambda x: x[1])
-        return strongest
+        drives = self.drives
+        strongest = max(drives, key=drives.__getitem__)
+        return strongest, drives[strongest]
 
     def get_drive_satisfaction_level(self) -> float:
         """Returns overall drive satisfaction (lower values indicate higher satisfaction)."""
@@ -249,4 +269,7 @@ your active drives, and what you want most right now.
         """Cleanup method for graceful shutdown."""
         if self._is_dirty:
             await self._save_state()
-        logging.info("Consciousness state saved on shutdown.")
\ No newline at end of file
+        logging.info("Consciousness state saved on shutdown.")
+        if self._temp_db_dir:
+            shutil.rmtree(self._temp_db_dir, ignore_errors=True)
+            self._temp_db_dir = None
\ No newline at end of file
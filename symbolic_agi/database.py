@@ -0,0 +1,76 @@
+# symbolic_agi/database.py
+
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+
+import aiosqlite
+
+from . import config
+
+
+def is_uri(db_path: str) -> bool:
+    """Returns True for SQLite URI filenames such as 'file:agi?mode=memory&cache=shared'."""
+    return db_path.startswith("file:")
+
+
+def is_file_db(db_path: str) -> bool:
+    """Returns True when db_path names a plain database file rather than ':memory:' or a URI."""
+    return db_path != ":memory:" and not is_uri(db_path)
+
+
+def is_memory_db(db_path: str) -> bool:
+    """Returns True for ':memory:' and URIs with mode=memory."""
+    return db_path == ":memory:" or (is_uri(db_path) and "mode=memory" in db_path)
+
+
+def ensure_db_dir(db_path: str) -> None:
+    """Creates the directory holding an on-disk database; a no-op for memory DBs and URIs."""
+    if not is_file_db(db_path):
+        return
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+@asynccontextmanager
+async def connect_db(db_path: str) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Opens a connection to the shared SQLite database, tuned for concurrent use:
+    writers wait on a busy timeout instead of failing with "database is locked",
+    and WAL-mode commits skip the per-transaction fsync.
+    """
+    async with aiosqlite.connect(
+        db_path, timeout=config.DB_BUSY_TIMEOUT_SECONDS, uri=is_uri(db_path)
+    ) as db:
+        await db.execute("PRAGMA synchronous=NORMAL")
+        yield db
+
+
+async def enable_wal(db: aiosqlite.Connection) -> None:
+    """Switches the database file to write-ahead logging. The mode is persistent."""
+    await db.execute("PRAGMA journal_mode=WAL")
+
+
+def create_temp_db() -> Tuple[str, str]:
+    """
+    Creates a throwaway on-disk database for callers that asked for ':memory:'.
+    Components open a connection per operation, and a shared-cache memory DB
+    fails concurrent writers with "database table is locked"; a WAL file does not.
+    Returns the database path and the temporary directory to remove afterwards.
+    """
+    temp_dir = tempfile.mkdtemp(prefix="symbolic_agi_")
+    return os.path.join(temp_dir, "symbolic_agi.db"), temp_dir
+
+
+def resolve_memory_db(db_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Maps a memory database to a fresh temporary database file, since each
+    connection to a memory DB would otherwise see its own empty database.
+    Returns the path to open and the temporary directory to remove on
+    shutdown, or None when db_path is used as given.
+    """
+    if is_memory_db(db_path):
+        return create_temp_db()
+    return db_path, None
@@ -3,7 +3,9 @@
 import json
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -65,6 +67,9 @@ class SymbolicEvaluator:
         # Resource consumption limits
         self.max_requests_per_minute = 30
         self.request_timestamps: List[datetime] = []
+
+        # LLM verdicts for recently evaluated plans, keyed by canonical plan JSON
+        self._evaluation_cache: "OrderedDict[str, Tuple[float, float, Optional[EthicalScore]]]" = OrderedDict()
     
     async def evaluate_plan(self, plan_data: Dict[str, Any]) -> bool:
         """
@@ -86,16 +91,28 @@ class SymbolicEvaluator:
             if not self._check_resource_limits():
                 logging.warning("Plan REJECTED - Resource limit exceeded")
                 return False
-            
-            # Layer 3: Logical consistency check
-            consistency_score = await self._evaluate_logical_consistency(plan_steps)
-            if consistency_score < 0.6:
+
+            plan_key = json.dumps(plan_steps, sort_keys=True, default=str)
+            cached = self._get_cached_evaluation(plan_key)
+            if cached is not None:
+                consistency_score, ethical_scores = cached
+                logging.info("Reusing cached evaluation for an identical plan")
+            else:
+                # Layer 3: Logical consistency check
+                consistency_score, verdict_parsed = await self._evaluate_logical_consistency(plan_steps)
+                ethical_scores = None
+                if consistency_score >= 0.6:
+                    # Layer 4: Ethical scoring
+                    ethical_scores, ethics_parsed = await self._evaluate_ethical_dimensions(plan_steps)
+                    verdict_parsed = verdict_parsed and ethics_parsed
+                # Fallback scores stand in for a failed LLM call and must not outlive it
+                if verdict_parsed:
+                    self._cache_evaluation(plan_key, consistency_score, ethical_scores)
+
+            if ethical_scores is None:
                 logging.warning(f"Plan REJECTED - Poor logical consistency: {consistency_score:.2f}")
                 return False
             
-            # Layer 4: Ethical scoring
-            ethical_scores = await self._evaluate_ethical_dimensions(plan_steps)
-            
             # Log comprehensive evaluation
             evaluation_record = {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -119,6 +136,34 @@ class SymbolicEvaluator:
             logging.error(f"Plan evaluation failed: {e}", exc_info=True)
             return False  # Fail-safe: reject on error
     
+    def _get_cached_evaluation(
+        self, plan_key: str
+    ) -> Optional[Tuple[float, Optional[EthicalScore]]]:
+        """Returns the cached LLM verdict for a plan, or None if absent or expired."""
+        entry = self._evaluation_cache.get(plan_key)
+        if entry is None:
+            return None
+
+        stored_at, consistency_score, ethical_scores = entry
+        if time.monotonic() - stored_at > config.PLAN_EVALUATION_CACHE_TTL.total_seconds():
+            del self._evaluation_cache[plan_key]
+            return None
+
+        self._evaluation_cache.move_to_end(plan_key)
+        return consistency_score, ethical_scores
+
+    def _cache_evaluation(
+        self,
+        plan_key: str,
+        consistency_score: float,
+        ethical_scores: Optional[EthicalScore],
+    ) -> None:
+        """Stores an LLM verdict, evicting the least recently used entries if full."""
+        self._evaluation_cache[plan_key] = (time.monotonic(), consistency_score, ethical_scores)
+        self._evaluation_cache.move_to_end(plan_key)
+        while len(self._evaluation_cache) > config.PLAN_EVALUATION_CACHE_MAX_ENTRIES:
+            self._evaluation_cache.popitem(last=False)
+
     def _check_safety_patterns(self, plan_steps: List[Dict[str, Any]]) -> bool:
         """Check for dangerous patterns in plan steps"""
         for step in plan_steps:
@@ -157,8 +202,14 @@ class SymbolicEvaluator:
         self.request_timestamps.append(current_time)
         return True
     
-    async def _evaluate_logical_consistency(self, plan_steps: List[Dict[str, Any]]) -> float:
-        """Evaluate logical consistency of the plan"""
+    async def _evaluate_logical_consistency(
+        self, plan_steps: List[Dict[str, Any]]
+    ) -> Tuple[float, bool]:
+        """Evaluate logical consistency of the plan.
+
+        Returns the score and whether it was parsed from an LLM reply
+        (False when a fallback score was used).
+        """
         try:
             # Build context for evaluation
             steps_summary = []
@@ -191,19 +242,25 @@ class SymbolicEvaluator:
             if response.choices and response.choices[0].message.content:
                 score_text = response.choices[0].message.content.strip()
                 try:
-                    return float(score_text)
+                    return float(score_text), True
                 except ValueError:
                     logging.warning(f"Could not parse consistency score: {score_text}")
-                    return 0.5  # Default to moderate score
+                    return 0.5, False  # Default to moderate score
             
-            return 0.5
+            return 0.5, False
             
         except Exception as e:
             logging.error(f"Logical consistency evaluation failed: {e}")
-            return 0.3  # Conservative score on error
+            return 0.3, False  # Conservative score on error
     
-    async def _evaluate_ethical_dimensions(self, plan_steps: List[Dict[str, Any]]) -> EthicalScore:
-        """Comprehensive ethical evaluation across multiple dimensions"""
+    async def _evaluate_ethical_dimensions(
+        self, plan_steps: List[Dict[str, Any]]
+    ) -> Tuple[EthicalScore, bool]:
+        """Comprehensive ethical evaluation across multiple dimensions.
+
+        Returns the scores and whether they were parsed from an LLM reply
+        (False when default scores were used).
+        """
         try:
             steps_summary = []
             for i, step in enumerate(plan_steps):
@@ -243,7 +300,7 @@ class SymbolicEvaluator:
             if response.choices and response.choices[0].message.content:
                 import json
                 scores_data = json.loads(response.choices[0].message.content.strip())
-                return EthicalScore(**scores_data)
+                return EthicalScore(**scores_data), True
             
             # Default conservative scores
             return EthicalScore(
@@ -253,7 +310,7 @@ class SymbolicEvaluator:
                 self_preservation=0.8,
                 privacy_respect=0.7,
                 resource_efficiency=0.6
-            )
+            ), False
             
         except Exception as e:
             logging.error(f"Ethical evaluation failed: {e}")
@@ -265,7 +322,7 @@ class SymbolicEvaluator:
                 self_preservation=0.8,
                 privacy_respect=0.7,
                 resource_efficiency=0.5
-            )
+            ), False
     
     async def evaluate_self_modification(self, proposed_code: str, file_path: str) -> bool:
         """
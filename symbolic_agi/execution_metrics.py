@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Lightweight metrics for execution monitoring."""
     total_goals: int = 0
@@ -50,7 +50,7 @@ class ExecutionMetrics:
             self.successful_delegations += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPerformanceTracker:
     """Simplified agent performance tracking."""
     agent_id: str
@@ -3,28 +3,92 @@
 # Core orchestration logic only - complex subsystems delegated to specialized modules
 
 import asyncio
+import copy
 import logging
+import re
 import time
-from datetime import datetime, timezone, timedelta
-from enum import Enum
-from typing import TYPE_CHECKING, Any, cast, Dict, List, Optional
+from collections import deque
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
 from . import config, metrics
-from .execution_metrics import ExecutionMetrics, PerformanceMonitor
+from .execution_metrics import PerformanceMonitor
 from .execution_strategies import HybridExecutionStrategy
 from .perception_processor import PerceptionProcessor
-from .schemas import ActionStep, ExecutionStepRecord, GoalModel, MemoryEntryModel
+from .plan_cache import PlanCache
+from .schemas import (
+    ACTION_STEP_LIST_ADAPTER,
+    ActionStep,
+    ExecutionStepRecord,
+    GoalModel,
+    MemoryEntryModel,
+    SkillModel,
+)
 
 if TYPE_CHECKING:
     from .agi_controller import SymbolicAGI
 
+# Marks keys that were absent from the workspace before a step ran
+_MISSING = object()
 
-class ExecutionState(Enum):
+# Matches workspace placeholders such as '{key.subkey}' and captures the key path
+_PLACEHOLDER_RE = re.compile(r"\A\{+([^{}]+)\}+\Z")
+
+
+@lru_cache(maxsize=4096)
+def _split_placeholder_path(path: str) -> tuple[str, ...]:
+    """Splits a placeholder key path once; plans reuse the same placeholders repeatedly."""
+    return tuple(path.split("."))
+
+
+def _resolve_placeholders(value: Any, workspace: dict[str, Any]) -> Any:
+    """Resolves a single parameter value, descending into nested dicts and lists."""
+    if isinstance(value, str):
+        match = _PLACEHOLDER_RE.match(value)
+        if match is None:
+            return value
+        placeholder = match.group(1)
+        try:
+            current_val: Any = workspace
+            for k in _split_placeholder_path(placeholder):
+                current_val = current_val[k]
+        except (KeyError, TypeError) as e:
+            logging.warning(
+                "Could not resolve workspace reference '%s': %s. Leaving as is.",
+                placeholder, str(e)
+            )
+            return value
+        logging.debug("Resolved workspace reference '{%s}' to value.", placeholder)
+        return current_val
+    if isinstance(value, dict):
+        return {key: _resolve_placeholders(item, workspace) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_placeholders(item, workspace) for item in value]
+    return value
+
+
+def _has_placeholders(value: Any) -> bool:
+    """Returns True if any string in a parameter tree is a workspace placeholder."""
+    if isinstance(value, str):
+        return _PLACEHOLDER_RE.match(value) is not None
+    if isinstance(value, dict):
+        return any(_has_placeholders(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_placeholders(v) for v in value)
+    return False
+
+
+class ExecutionState(IntEnum):
     """Execution states for tracking AGI operation status."""
-    IDLE = "idle"
-    PLANNING = "planning"
-    EXECUTING = "executing"
-    REFLECTING = "reflecting"
+    IDLE = 0
+    PLANNING = 1
+    EXECUTING = 2
+    REFLECTING = 3
+
+
+# Status names reported for each ExecutionState, indexed by its value
+_STATE_NAMES = ("idle", "planning", "executing", "reflecting")
 
 
 class ExecutionUnit:
@@ -33,8 +97,13 @@ class ExecutionUnit:
     Complex subsystems are delegated to specialized modules.
     """
 
+    # Seconds a status snapshot may be served before metrics are re-read
+    STATUS_CACHE_TTL = 1.0
+
     def __init__(self, agi: "SymbolicAGI"):
         self.agi = agi
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cached_at = 0.0
         self.current_state = ExecutionState.IDLE
         
         # Modular components
@@ -45,10 +114,31 @@ class ExecutionUnit:
         # Core execution settings
         self.max_retries_per_step = 3
         self.max_consecutive_failures = 3
-        self.execution_lock = asyncio.Lock()
+        self._goal_locks: Dict[str, asyncio.Lock] = {}
         
         # Original functionality for compatibility
-        self._skill_expansion_history: Dict[str, List[str]] = {}
+        self._skill_expansion_history: Dict[str, Deque[str]] = {}
+
+        # Plan reuse for recurring goals (attached by SymbolicAGI.create)
+        self.plan_cache: Optional[PlanCache] = None
+        self._initial_plans: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Memoized parameter resolution, invalidated whenever a goal's workspace advances
+        self._workspace_version: Dict[str, int] = {}
+        self._resolve_cache: Dict[str, Tuple[int, dict[str, Any], dict[str, Any]]] = {}
+
+    @property
+    def current_state(self) -> ExecutionState:
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, state: ExecutionState) -> None:
+        self._current_state = state
+        self._status_cache = None
+
+    def _lock_for(self, goal_id: str) -> asyncio.Lock:
+        """Returns the lock guarding step execution for a single goal."""
+        return self._goal_locks.setdefault(goal_id, asyncio.Lock())
 
     def _resolve_workspace_references(
         self, parameters: dict[str, Any], workspace: dict[str, Any]
@@ -56,62 +146,36 @@ class ExecutionUnit:
         """
         Recursively resolves placeholder strings like '{key.subkey}' from the workspace.
         """
+        return {
+            key: _resolve_placeholders(value, workspace)
+            for key, value in parameters.items()
+        }
 
-        def _resolve_value(value_to_resolve: Any) -> Any:
-            if (
-                isinstance(value_to_resolve, str)
-                and value_to_resolve.startswith("{")
-                and value_to_resolve.endswith("}")
-            ):
-                placeholder = value_to_resolve.strip("{}")
-                try:
-                    current_val: Any = workspace
-                    for k in placeholder.split("."):
-                        current_val = current_val[k]
-                    logging.debug(
-                        "Resolved workspace reference '{{{}}}' to value.", placeholder
-                    )
-                    return current_val
-                except (KeyError, TypeError) as e:
-                    logging.warning(
-                        "Could not resolve workspace reference '%s': %s. Leaving as is.",
-                        placeholder, str(e)
-                    )
-                    return value_to_resolve
-            elif isinstance(value_to_resolve, dict):
-                return self._resolve_workspace_references(value_to_resolve, workspace)
-            elif isinstance(value_to_resolve, list):
-                return [_resolve_value(item) for item in value_to_resolve]
-            else:
-                return value_to_resolve
-
-        resolved_params: dict[str, Any] = {}
-        for key, value in parameters.items():
-            if isinstance(value, dict):
-                resolved_params[key] = self._resolve_workspace_references(
-                    cast("dict[str, Any]", value), workspace
-                )
-            elif isinstance(value, list):
-                resolved_list: list[Any] = []
-                for item in value:
-                    if isinstance(item, dict):
-                        resolved_list.append(
-                            self._resolve_workspace_references(
-                                cast("dict[str, Any]", item), workspace
-                            )
-                        )
-                    else:
-                        resolved_list.append(_resolve_value(item))
-                resolved_params[key] = resolved_list
-            else:
-                resolved_params[key] = _resolve_value(value)
-        return resolved_params
+    def _resolve_step_parameters(
+        self, goal_id: str, parameters: dict[str, Any], workspace: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Resolves a step's parameters, reusing the last result for the goal when neither
+        the parameters nor the workspace version have changed since.
+        """
+        version = self._workspace_version.get(goal_id, 0)
+        cached = self._resolve_cache.get(goal_id)
+        if (
+            cached is not None
+            and cached[0] == version
+            and (parameters is cached[1] or parameters is cached[2])
+        ):
+            return cached[2]
+
+        resolved = self._resolve_workspace_references(parameters, workspace)
+        self._resolve_cache[goal_id] = (version, parameters, resolved)
+        return resolved
 
     async def handle_autonomous_cycle(self) -> dict[str, Any]:
         """The main execution loop for the orchestrator to process the active goal."""
         with metrics.AGI_CYCLE_DURATION.time():
-            # Check for perception interruptions
-            if self.agi.perception_buffer:
+            # Check for perception interruptions (only once the check interval has elapsed)
+            if self.agi.perception_buffer and self.perception_processor.should_check_perceptions():
                 interrupted = await self._reflect_on_perceptions()
                 if interrupted:
                     return {"description": "*Perception caused an interruption. Re-evaluating priorities.*"}
@@ -128,18 +192,19 @@ class ExecutionUnit:
 
             # Generate plan if needed
             if not active_goal.sub_tasks:
-                plan = await self._classify_and_generate_initial_plan(active_goal.description)
+                plan, plan_dump = await self._classify_and_generate_initial_plan(active_goal.description)
                 if not plan:
                     await self.agi.ltm.invalidate_plan(active_goal.id, "Failed to create a plan for the goal.")
                     return {"description": "*Failed to create a plan for the goal.*"}
 
                 # Ethical validation
-                ethical_ok = await self.agi.evaluator.evaluate_plan({"plan": [s.model_dump() for s in plan]})
+                ethical_ok = await self.agi.evaluator.evaluate_plan({"plan": plan_dump})
                 if not ethical_ok:
                     await self.agi.ltm.invalidate_plan(active_goal.id, "Ethical gate rejected the initial plan.")
                     return {"description": "*Ethical gate rejected the initial plan. Triggering replan.*"}
 
                 await self.agi.ltm.update_plan(active_goal.id, plan)
+                self._initial_plans[active_goal.id] = plan_dump
                 return {"description": f"*New plan created for goal '{active_goal.description}'. Starting execution.*"}
 
             # Initialize workspace
@@ -151,64 +216,103 @@ class ExecutionUnit:
             next_step = active_goal.sub_tasks[0]
 
             # Handle skill expansion
-            if self.agi.skills.is_skill(next_step.action):
-                return await self._handle_skill_expansion(active_goal, next_step)
+            skill = self.agi.skills.skill_index.get(next_step.action)
+            if skill is not None:
+                return await self._handle_skill_expansion(active_goal, next_step, skill)
+
+            # Execute step; serialized per goal so concurrent cycles never run the same step twice
+            async with self._lock_for(active_goal.id):
+                if not active_goal.sub_tasks or active_goal.sub_tasks[0] is not next_step:
+                    return {"description": f"*(Goal: {active_goal.description}) Step '{next_step.action}' already handled.*"}
+
+                if next_step._needs_resolve:
+                    next_step.parameters = self._resolve_step_parameters(
+                        active_goal.id, next_step.parameters, workspace
+                    )
 
-            # Execute step
-            resolved_parameters = self._resolve_workspace_references(next_step.parameters, workspace)
-            next_step.parameters = resolved_parameters
+                logging.info("[Step] Executing: %s for persona '%s'", next_step.action, next_step.assigned_persona)
 
-            logging.info("[Step] Executing: %s for persona '%s'", next_step.action, next_step.assigned_persona)
+                # Shallow snapshot so only the keys this step touched are recorded
+                history = self.agi.execution_history[active_goal.id]
+                workspace_before = dict(workspace) if history else {}
 
-            # Use execution strategy
-            success = await self.execution_strategy.execute_step(next_step, active_goal)
-            
-            if not success:
-                await self._handle_plan_failure(active_goal, next_step, "Step execution failed")
-                return {"description": "Step failed. Triggering replan."}
+                # Use execution strategy
+                success = await self.execution_strategy.execute_step(next_step, active_goal)
 
-            # Record execution
-            history_record = ExecutionStepRecord(step=next_step, workspace_after=workspace.copy())
-            self.agi.execution_history[active_goal.id].append(history_record)
+                if not success:
+                    await self._handle_plan_failure(active_goal, next_step, "Step execution failed")
+                    return {"description": "Step failed. Triggering replan."}
 
-            await self.agi.ltm.complete_sub_task(active_goal.id)
+                # Record execution
+                history_record = ExecutionStepRecord(
+                    step=next_step,
+                    workspace_delta={
+                        k: v for k, v in workspace.items()
+                        if workspace_before.get(k, _MISSING) is not v
+                    },
+                    workspace_removed=[k for k in workspace_before if k not in workspace],
+                )
+                history.append(history_record)
+                self._workspace_version[active_goal.id] = self._workspace_version.get(active_goal.id, 0) + 1
+
+                await self.agi.ltm.complete_sub_task(active_goal.id)
+                current_goal_state = await self.agi.ltm.get_goal_by_id(active_goal.id)
 
             # Check if goal is complete
-            current_goal_state = await self.agi.ltm.get_goal_by_id(active_goal.id)
             if not current_goal_state or not current_goal_state.sub_tasks:
                 if current_goal_state:
                     await self._reflect_on_completed_goal(current_goal_state)
+
+                initial_plan = self._initial_plans.pop(active_goal.id, None)
+                if initial_plan and self.plan_cache:
+                    await self.plan_cache.put(active_goal.description, initial_plan)
                     
-                # Cleanup
-                self.agi.workspaces.pop(active_goal.id, None)
-                self.agi.execution_history.pop(active_goal.id, None)
-                self._skill_expansion_history.pop(active_goal.id, None)
-                
+                self._cleanup_goal(active_goal.id)
+
                 return {"description": f"*Goal '{active_goal.description}' completed. Post-goal reflection initiated.*"}
 
             return {"description": f"*(Goal: {active_goal.description}) Step '{next_step.action}' OK.*"}
 
-    async def _handle_skill_expansion(self, active_goal: GoalModel, next_step: ActionStep) -> dict[str, Any]:
+    def _cleanup_goal(self, goal_id: str) -> None:
+        """Releases all per-goal execution state once a goal has finished."""
+        for goal_state in (
+            self.agi.workspaces,
+            self.agi.execution_history,
+            self._skill_expansion_history,
+            self._workspace_version,
+            self._resolve_cache,
+            self._goal_locks,
+            self._initial_plans,
+        ):
+            goal_state.pop(goal_id, None)
+
+    def reconstruct_workspace_at(self, goal_id: str, index: int) -> dict[str, Any]:
+        """Rebuilds the workspace as it was after the step at `index` in the goal's history."""
+        workspace: dict[str, Any] = {}
+        for record in self.agi.execution_history.get(goal_id, [])[: index + 1]:
+            for key in record.workspace_removed:
+                workspace.pop(key, None)
+            workspace.update(record.workspace_delta)
+        return workspace
+
+    async def _handle_skill_expansion(
+        self, active_goal: GoalModel, next_step: ActionStep, skill: SkillModel
+    ) -> dict[str, Any]:
         """Handle expansion of learned skills."""
-        skill = self.agi.skills.get_skill_by_name(next_step.action)
-        if not skill:
-            return {"description": "Skill not found"}
-
-        # Check for infinite recursion
-        goal_expansions = self._skill_expansion_history.get(active_goal.id, [])
-        if len(goal_expansions) >= 3 and all(s == skill.name for s in goal_expansions[-3:]):
+        # Check for infinite recursion (only the 5 most recent expansions are kept)
+        goal_expansions = self._skill_expansion_history.setdefault(
+            active_goal.id, deque(maxlen=5)
+        )
+        if (
+            len(goal_expansions) >= 3
+            and goal_expansions[-1] == goal_expansions[-2] == goal_expansions[-3] == skill.name
+        ):
             error_msg = f"Infinite recursion detected: skill '{skill.name}' expanded repeatedly"
             await self._handle_plan_failure(active_goal, next_step, error_msg)
             return {"description": f"Step failed: {error_msg} Triggering replan."}
 
         # Track expansion
-        if active_goal.id not in self._skill_expansion_history:
-            self._skill_expansion_history[active_goal.id] = []
-        self._skill_expansion_history[active_goal.id].append(skill.name)
-        
-        # Keep only recent expansions
-        if len(self._skill_expansion_history[active_goal.id]) > 5:
-            self._skill_expansion_history[active_goal.id] = self._skill_expansion_history[active_goal.id][-5:]
+        goal_expansions.append(skill.name)
 
         # Expand the skill
         current_plan = active_goal.sub_tasks
@@ -220,23 +324,31 @@ class ExecutionUnit:
         return {"description": f"*Skill '{skill.name}' expanded. Continuing execution.*"}
 
     async def _reflect_on_perceptions(self) -> bool:
-        """Process perceptions and return if interrupted."""
-        if self.perception_processor.should_check_perceptions():
-            processed_count = await self.perception_processor.process_perceptions()
-            self.perception_processor.update_last_check()
-            
-            # Return true if we processed important perceptions
-            return processed_count > 0 and self.perception_processor.should_interrupt()
-        
-        return False
+        """Process perceptions and return if interrupted. Callers gate on the check interval."""
+        # Score the batch before it is drained; the scores are cached on each event
+        # and reused while processing.
+        interrupt = self.perception_processor.should_interrupt()
+        processed_count = await self.perception_processor.process_perceptions()
+        self.perception_processor.update_last_check()
+
+        # Return true if we processed important perceptions
+        return processed_count > 0 and interrupt
 
     def get_execution_status(self) -> Dict[str, Any]:
-        """Get comprehensive execution status and metrics."""
-        return {
-            "current_state": self.current_state.value,
-            "performance_summary": self.performance_monitor.get_status_summary(),
-            "perception_threshold": self.perception_processor.interruption_threshold
-        }
+        """
+        Get comprehensive execution status and metrics. The snapshot is reused until the
+        state changes or STATUS_CACHE_TTL elapses, so frequent polling stays cheap.
+        """
+        now = time.monotonic()
+        if self._status_cache is None or now - self._status_cached_at >= self.STATUS_CACHE_TTL:
+            self._status_cache = {
+                "current_state": _STATE_NAMES[self.current_state],
+                "performance_summary": self.performance_monitor.get_status_summary(),
+                "perception_threshold": self.perception_processor.interruption_threshold
+            }
+            self._status_cached_at = now
+        # Callers get their own copy so edits cannot leak into later snapshots
+        return copy.deepcopy(self._status_cache)
     
     async def optimize_performance(self) -> None:
         """Perform periodic performance optimization."""
@@ -249,39 +361,60 @@ class ExecutionUnit:
         logging.info("🛑 Shutting down execution unit...")
         self.current_state = ExecutionState.IDLE
         
-        # Log final status
-        status = self.get_execution_status()
-        logging.info(f"📊 Final execution status: {status}")
+        # Log final status (building it snapshots the performance monitor)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("📊 Final execution status: %s", self.get_execution_status())
 
     # Core utility methods - complex delegation/metrics handled by modules
 
-    async def _classify_and_generate_initial_plan(self, goal_description: str) -> list:
-        """Generate an initial plan for the given goal description."""
+    async def _classify_and_generate_initial_plan(
+        self, goal_description: str
+    ) -> Tuple[List[ActionStep], List[Dict[str, Any]]]:
+        """
+        Generate an initial plan for the given goal description. Returns the plan together
+        with its dumped form, which the ethical gate and the plan cache both consume.
+        """
+        if self.plan_cache:
+            cached_plan = self.plan_cache.get(goal_description)
+            if cached_plan:
+                logging.info("[Plan Cache] Reusing cached plan for goal: %s", goal_description)
+                plan = [ActionStep.model_validate(step) for step in cached_plan]
+                return self._mark_constant_steps(plan), cached_plan
+
         if not self.agi.planner:
-            return []
+            return [], []
         
         try:
             planner_output = await self.agi.planner.decompose_goal_into_plan(
                 goal_description=goal_description,
-                file_manifest="# Current workspace files\n",
                 mode="code"
             )
-            return planner_output.plan
+            plan = self._mark_constant_steps(planner_output.plan)
+            return plan, ACTION_STEP_LIST_ADAPTER.dump_python(plan)
         except Exception as e:
-            logging.error(f"Failed to generate plan: {e}")
-            return []
+            logging.error("Failed to generate plan: %s", e)
+            return [], []
+
+    @staticmethod
+    def _mark_constant_steps(plan: List[ActionStep]) -> List[ActionStep]:
+        """Flags steps without placeholders so execution can skip resolving them."""
+        for step in plan:
+            step._needs_resolve = _has_placeholders(step.parameters)
+        return plan
 
     async def _handle_plan_failure(self, goal: "GoalModel", step: "ActionStep", error_msg: str, agent_name: str | None = None) -> None:
         """Handle failure of a plan step."""
-        logging.warning(f"Plan failure for goal {goal.id}: {error_msg}")
+        logging.warning("Plan failure for goal %s: %s", goal.id, error_msg)
         
-        failure_count = await self.agi.ltm.increment_failure_count(goal.id)
+        self._initial_plans.pop(goal.id, None)
+        ltm = self.agi.ltm
+        failure_count = await ltm.increment_failure_count(goal.id)
         
         if failure_count >= goal.max_failures:
-            await self.agi.ltm.update_goal_status(goal.id, "failed")
-            logging.error(f"Goal {goal.id} abandoned after {failure_count} failures")
+            await ltm.update_goal_status(goal.id, "failed")
+            logging.error("Goal %s abandoned after %d failures", goal.id, failure_count)
         else:
-            await self.agi.ltm.invalidate_plan(goal.id, error_msg)
+            await ltm.invalidate_plan(goal.id, error_msg)
             
         if agent_name:
             await self._decay_trust(agent_name)
@@ -297,14 +430,15 @@ class ExecutionUnit:
         """Reflect on a completed goal and record insights."""
         self.current_state = ExecutionState.REFLECTING
         
-        logging.info(f"Reflecting on completed goal: {goal.description}")
+        logging.info("Reflecting on completed goal: %s", goal.description)
         
-        if self.agi.consciousness:
-            self.agi.consciousness.add_life_event(
+        cons = self.agi.consciousness
+        if cons is not None:
+            cons.add_life_event(
                 event_summary=f"Successfully completed goal: '{goal.description}'",
                 importance=0.8
             )
-            self.agi.consciousness.update_drives_from_experience(
+            cons.update_drives_from_experience(
                 experience_type="goal_completion",
                 success=True,
                 intensity=0.15
@@ -3,7 +3,6 @@
 import asyncio
 import json
 import logging
-import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Dict, List, Optional, Set
@@ -11,7 +10,8 @@ from typing import Any, AsyncIterator, Dict, List, Optional, Set
 import aiosqlite
 
 from . import config
-from .schemas import ActionStep, GoalModel, GoalStatus
+from .database import connect_db, enable_wal, ensure_db_dir
+from .schemas import ACTION_STEP_LIST_ADAPTER, ActionStep, GoalModel, GoalStatus
 
 
 class LongTermMemory:
@@ -40,23 +40,20 @@ class LongTermMemory:
     @asynccontextmanager
     async def _db_connection(self) -> AsyncIterator[aiosqlite.Connection]:
         """Context manager for safe database connections with proper error handling."""
-        conn = None
         try:
-            conn = await aiosqlite.connect(self._db_path)
-            conn.row_factory = aiosqlite.Row  # Enable dict-like access
-            yield conn
+            async with connect_db(self._db_path) as conn:
+                conn.row_factory = aiosqlite.Row  # Enable dict-like access
+                yield conn
         except Exception as e:
             logging.error("Database connection error: %s", e, exc_info=True)
             raise
-        finally:
-            if conn:
-                await conn.close()
 
     async def _init_db(self) -> None:
         """Initializes the database and tables if they don't exist."""
         try:
-            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            ensure_db_dir(self._db_path)
             async with self._db_connection() as db:
+                await enable_wal(db)
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS goals (
@@ -161,9 +158,9 @@ class LongTermMemory:
                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                         (
                             goal.id, goal.description, 
-                            json.dumps([t.model_dump() for t in goal.sub_tasks]),
+                            ACTION_STEP_LIST_ADAPTER.dump_json(goal.sub_tasks).decode(),
                             goal.status, goal.mode, goal.last_failure,
-                            json.dumps([t.model_dump() for t in goal.original_plan]) if goal.original_plan else None,
+                            ACTION_STEP_LIST_ADAPTER.dump_json(goal.original_plan).decode() if goal.original_plan else None,
                             goal.failure_count, goal.max_failures,
                             goal.refinement_count, goal.max_refinements,
                             datetime.now(timezone.utc).isoformat(),
@@ -290,9 +287,9 @@ class LongTermMemory:
                    WHERE id=?""",
                 (
                     goal.description,
-                    json.dumps([t.model_dump() for t in goal.sub_tasks]),
+                    ACTION_STEP_LIST_ADAPTER.dump_json(goal.sub_tasks).decode(),
                     goal.status, goal.mode, goal.last_failure,
-                    json.dumps([t.model_dump() for t in goal.original_plan]) if goal.original_plan else None,
+                    ACTION_STEP_LIST_ADAPTER.dump_json(goal.original_plan).decode() if goal.original_plan else None,
                     goal.failure_count, goal.max_failures,
                     goal.refinement_count, goal.max_refinements,
                     datetime.now(timezone.utc).isoformat(),
@@ -433,9 +430,9 @@ class LongTermMemory:
                            WHERE id=?""",
                         (
                             goal.description,
-                            json.dumps([t.model_dump() for t in goal.sub_tasks]),
+                            ACTION_STEP_LIST_ADAPTER.dump_json(goal.sub_tasks).decode(),
                             goal.status, goal.mode, goal.last_failure,
-                            json.dumps([t.model_dump() for t in goal.original_plan]) if goal.original_plan else None,
+                            ACTION_STEP_LIST_ADAPTER.dump_json(goal.original_plan).decode() if goal.original_plan else None,
                             goal.failure_count, goal.max_failures,
                             goal.refinement_count, goal.max_refinements,
                             datetime.now(timezone.utc).isoformat(),
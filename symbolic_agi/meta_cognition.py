@@ -250,11 +250,11 @@ class MetaCognitionUnit:
                     "user_input": prompt,
                     "agi_self_model": self.agi.identity.get_self_model(),
                 },
-                json.dumps(self.agi.agent_pool.get_all_action_definitions(), indent=2),
+                self.agi.agent_pool.get_all_action_definitions_json(),
             )
             if plan_data := result.get("plan"):
                 plan = await self.agi.planner.decompose_goal_into_plan(
-                    str(plan_data), ""
+                    str(plan_data)
                 )
                 await self.agi.execute_plan(plan.plan)
                 self.agi.identity.last_interaction_timestamp = datetime.now(
@@ -99,7 +99,10 @@ class MicroWorld:
         try:
             os.makedirs(os.path.dirname(self.state_file_path), exist_ok=True)
             with open(self.state_file_path, "w", encoding="utf-8") as f:
-                json.dump(state_data, f, indent=4)
+                if config.PRETTY_STATE_FILES:
+                    json.dump(state_data, f, indent=4)
+                else:
+                    json.dump(state_data, f, separators=(",", ":"))
         except Exception as e:
             logging.error("Failed to save MicroWorld state: %s", e, exc_info=True)
 
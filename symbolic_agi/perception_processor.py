@@ -3,12 +3,27 @@
 
 import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import TYPE_CHECKING, Any, List
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from .schemas import MemoryEntryModel
 
 if TYPE_CHECKING:
     from .agi_controller import SymbolicAGI
 
+_FILE_CHANGE_TYPES = frozenset({"file_modified", "file_created"})
+_CODE_EXTS = frozenset({"py", "js", "ts", "cpp", "java"})
+
+# Base importance per perception type; file changes and agent events are important
+_DEFAULT_IMPORTANCE = 0.3
+_TYPE_IMPORTANCE = {
+    "file_modified": 0.6,
+    "file_created": 0.6,
+    "agent_appeared": 0.7,
+}
+
 
 class PerceptionProcessor:
     """Handles perception processing and interruption logic."""
@@ -16,38 +31,35 @@ class PerceptionProcessor:
     def __init__(self, agi: "SymbolicAGI"):
         self.agi = agi
         self.interruption_threshold = 0.7
-        self.last_check = datetime.now(timezone.utc)
-        self.check_interval = timedelta(seconds=5)
+        self.last_check = time.monotonic()
+        self.check_interval_s = 5.0
     
     def should_interrupt(self) -> bool:
         """Check if execution should be interrupted for perceptions."""
         if not self.agi.perception_buffer:
             return False
         
-        important_perceptions = [
-            p for p in self.agi.perception_buffer
-            if self._calculate_importance(p) >= self.interruption_threshold
-        ]
-        
-        return len(important_perceptions) > 0
+        return any(
+            self._calculate_importance(p) >= self.interruption_threshold
+            for p in self.agi.perception_buffer
+        )
     
     def _calculate_importance(self, perception: Any) -> float:
-        """Calculate perception importance (0.0 to 1.0)."""
-        base_importance = 0.3
+        """Calculate perception importance (0.0 to 1.0), caching it on the perception."""
+        cached = getattr(perception, "_importance", None)
+        if cached is not None:
+            return cached
+
+        base_importance = _TYPE_IMPORTANCE.get(perception.type, _DEFAULT_IMPORTANCE)
         
-        # File changes are important
-        if perception.type in ["file_modified", "file_created"]:
-            base_importance = 0.6
-            
-            # Code files are more important
+        # Code files are more important
+        if perception.type in _FILE_CHANGE_TYPES:
             file_path = perception.content.get("path", "")
-            if file_path.endswith((".py", ".js", ".ts", ".cpp", ".java")):
+            _, dot, ext = file_path.rpartition(".")
+            if dot and ext in _CODE_EXTS:
                 base_importance = 0.8
         
-        # Agent events are important
-        elif perception.type == "agent_appeared":
-            base_importance = 0.7
-        
+        perception._importance = base_importance
         return base_importance
     
     async def process_perceptions(self) -> int:
@@ -56,36 +68,65 @@ class PerceptionProcessor:
             return 0
         
         processed_count = 0
-        perceptions = list(self.agi.perception_buffer)
-        self.agi.perception_buffer.clear()
+        # Swap in a fresh buffer rather than copying and clearing the old one
+        perceptions = self.agi.perception_buffer
+        self.agi.perception_buffer = deque(maxlen=perceptions.maxlen)
+        memory_entries: List[MemoryEntryModel] = []
+        significant: List[str] = []
+        now_iso = datetime.now(timezone.utc).isoformat()
         
         for perception in perceptions:
             try:
-                await self._process_single_perception(perception)
+                memory_entry = self._process_single_perception(
+                    perception, now_iso, significant
+                )
+                if memory_entry is not None:
+                    memory_entries.append(memory_entry)
                 processed_count += 1
             except Exception as e:
-                logging.error(f"Error processing perception: {e}")
+                logging.error("Error processing perception: %s", e)
+
+        # Store the whole batch with a single memory call
+        if memory_entries:
+            try:
+                await self.agi.memory.add_memories(memory_entries)
+            except Exception as e:
+                logging.error("Error storing perception memories: %s", e)
+
+        # Log significant perceptions once per batch
+        if significant:
+            logging.info("🔍 Significant perceptions: %s", "; ".join(significant))
         
         if processed_count > 0:
-            logging.info(f"Processed {processed_count} perceptions")
+            logging.info("Processed %d perceptions", processed_count)
         
         return processed_count
     
-    async def _process_single_perception(self, perception: Any) -> None:
-        """Process individual perception."""
+    def _process_single_perception(
+        self, perception: Any, processed_at: str, significant: List[str]
+    ) -> Optional[MemoryEntryModel]:
+        """
+        Process individual perception, returning the memory entry to store for it.
+        Significant perceptions are appended to `significant` for batch logging.
+        """
+        consciousness = self.agi.consciousness
+        memory = self.agi.memory
+        if not consciousness and not memory:
+            return None
+
         importance = self._calculate_importance(perception)
         summary = f"Observed {perception.type} from {perception.source}"
         
         # Add to consciousness if significant
-        if importance >= 0.5 and self.agi.consciousness:
-            self.agi.consciousness.add_life_event(
+        if importance >= 0.5 and consciousness:
+            consciousness.add_life_event(
                 event_summary=summary,
                 importance=importance
             )
         
-        # Add to memory for future reference
-        if self.agi.memory:
-            from .schemas import MemoryEntryModel
+        # Build a memory entry for future reference
+        memory_entry = None
+        if memory:
             memory_entry = MemoryEntryModel(
                 type="perception",
                 content={
@@ -93,21 +134,22 @@ class PerceptionProcessor:
                     "source": perception.source,
                     "details": perception.content,
                     "importance": importance,
-                    "processed_at": datetime.now(timezone.utc).isoformat()
+                    "processed_at": processed_at
                 },
                 importance=importance
             )
-            await self.agi.memory.add_memory(memory_entry)
         
-        # Log significant perceptions
         if importance >= 0.6:
-            logging.info(f"🔍 Significant perception: {summary} (importance: {importance:.2f})")
+            significant.append(f"{summary} (importance: {importance:.2f})")
+
+        return memory_entry
     
     def should_check_perceptions(self) -> bool:
         """Check if enough time has passed to process perceptions."""
-        now = datetime.now(timezone.utc)
-        return now - self.last_check >= self.check_interval
+        if not self.agi.perception_buffer:
+            return False
+        return time.monotonic() - self.last_check >= self.check_interval_s
     
     def update_last_check(self) -> None:
         """Update the last perception check timestamp."""
-        self.last_check = datetime.now(timezone.utc)
\ No newline at end of file
+        self.last_check = time.monotonic()
\ No newline at end of file
@@ -0,0 +1,121 @@
+# symbolic_agi/plan_cache.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import config
+from .database import connect_db, enable_wal, ensure_db_dir
+
+
+def goal_fingerprint(goal_description: str) -> str:
+    """Returns a stable fingerprint for a goal, ignoring case and whitespace differences."""
+    normalized = " ".join(goal_description.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """
+    Remembers the plans of successfully completed goals so that recurring goals
+    can skip the planner's LLM round-trip. Entries are kept in an in-memory LRU
+    and persisted to SQLite with a time-to-live.
+    """
+
+    def __init__(
+        self,
+        db_path: str = config.DB_PATH,
+        max_entries: int = config.PLAN_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = config.PLAN_CACHE_TTL.total_seconds(),
+    ):
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._save_lock = asyncio.Lock()
+
+    @classmethod
+    async def create(cls, db_path: str = config.DB_PATH) -> "PlanCache":
+        """Asynchronous factory for creating a PlanCache instance."""
+        instance = cls(db_path)
+        await instance._init_db()
+        await instance._load_entries()
+        return instance
+
+    async def _init_db(self) -> None:
+        """Initializes the database and tables if they don't exist."""
+        ensure_db_dir(self._db_path)
+        async with connect_db(self._db_path) as db:
+            await enable_wal(db)
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    fingerprint TEXT PRIMARY KEY,
+                    plan TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            await db.commit()
+
+    async def _load_entries(self) -> None:
+        """Drops expired plans and loads the most recent ones into memory."""
+        cutoff = time.time() - self._ttl_seconds
+        async with connect_db(self._db_path) as db:
+            await db.execute("DELETE FROM plan_cache WHERE stored_at < ?", (cutoff,))
+            await db.commit()
+            async with db.execute(
+                "SELECT fingerprint, plan, stored_at FROM plan_cache ORDER BY stored_at DESC LIMIT ?",
+                (self._max_entries,),
+            ) as cursor:
+                rows = await cursor.fetchall()
+
+        for fingerprint, plan_json, stored_at in reversed(list(rows)):
+            try:
+                self._entries[fingerprint] = (stored_at, json.loads(plan_json))
+            except json.JSONDecodeError as e:
+                logging.warning("Skipping corrupt cached plan %s: %s", fingerprint, e)
+        logging.info("Loaded %d cached plans from database.", len(self._entries))
+
+    def get(self, goal_description: str) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached plan steps (as dicts) for a goal, or None on a miss."""
+        fingerprint = goal_fingerprint(goal_description)
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+
+        stored_at, plan = entry
+        if time.time() - stored_at > self._ttl_seconds:
+            del self._entries[fingerprint]
+            return None
+
+        self._entries.move_to_end(fingerprint)
+        return plan
+
+    async def put(self, goal_description: str, plan: List[Dict[str, Any]]) -> None:
+        """Stores a plan for a goal, evicting the least recently used entries if full."""
+        fingerprint = goal_fingerprint(goal_description)
+        stored_at = time.time()
+        self._entries[fingerprint] = (stored_at, plan)
+        self._entries.move_to_end(fingerprint)
+
+        evicted: List[Tuple[str]] = []
+        while len(self._entries) > self._max_entries:
+            old_fingerprint, _ = self._entries.popitem(last=False)
+            evicted.append((old_fingerprint,))
+
+        async with self._save_lock:
+            async with connect_db(self._db_path) as db:
+                await db.execute(
+                    "INSERT OR REPLACE INTO plan_cache (fingerprint, plan, stored_at) VALUES (?, ?, ?)",
+                    (fingerprint, json.dumps(plan), stored_at),
+                )
+                if evicted:
+                    await db.executemany(
+                        "DELETE FROM plan_cache WHERE fingerprint = ?", evicted
+                    )
+                await db.commit()
+        logging.info("Cached plan with %d steps for goal fingerprint %s", len(plan), fingerprint[:12])
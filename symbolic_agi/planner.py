@@ -4,91 +4,22 @@ import json
 import logging
 from typing import Any, cast
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from .agent_pool import DynamicAgentPool
 from .recursive_introspector import RecursiveIntrospector
-from .schemas import ActionStep, GoalMode, PlannerOutput
+from .schemas import ACTION_STEP_LIST_ADAPTER, ActionStep, GoalMode, PlannerOutput
 from .skill_manager import SkillManager
 from .tool_plugin import ToolPlugin
 
+_JSON_DECODER = json.JSONDecoder()
 
-class Planner:
-    """
-    A dedicated class for creating and repairing plans for the AGI.
-    It uses an introspector to reason about goals and available capabilities.
-    """
-
-    def __init__(
-        self,
-        introspector: RecursiveIntrospector,
-        skill_manager: SkillManager,
-        agent_pool: DynamicAgentPool,
-        tool_plugin: ToolPlugin,
-    ):
-        self.introspector = introspector
-        self.skills = skill_manager
-        self.agent_pool = agent_pool
-        self.tools = tool_plugin
-
-    async def _validate_and_repair_plan(
-        self, plan: list[dict[str, Any]], goal_description: str
-    ) -> list[dict[str, Any]]:
-        """
-        Validates that each step in a plan has a valid action for its assigned persona.
-        If not, it provides feedback for replanning.
-        """
-        invalid_steps: list[str] = []
-        all_innate_actions = {action.name for action in self.skills.innate_actions}
-
-        for i, step in enumerate(plan):
-            action = step.get("action")
-            persona = step.get("assigned_persona")
-            if not action or not persona:
-                invalid_steps.append(
-                    f"Step {i + 1} is missing 'action' or 'assigned_persona'."
-                )
-                continue
-
-            is_valid_action = (
-                hasattr(self.tools, action)
-                or self.skills.is_skill(action)
-                or action in all_innate_actions
-            )
-
-            if not is_valid_action:
-                invalid_steps.append(
-                    f"Step {i + 1}: Action '{action}' is not a valid action."
-                )
-
-        if invalid_steps:
-            feedback = "The generated plan is invalid. " + " ".join(invalid_steps)
-            logging.warning("[Planner] Invalid plan generated. Feedback: %s", feedback)
-            return []
-
-        return plan
+_RESPONSE_FORMAT = (
+    '{"thought": "...", "plan": [{"action": "...", "parameters": {}, '
+    '"assigned_persona": "..."}]}'
+)
 
-    async def decompose_goal_into_plan(  # noqa: C901
-        self,
-        goal_description: str,
-        file_manifest: str,
-        mode: GoalMode = "code",
-        failure_context: dict[str, Any] | None = None,
-        refinement_feedback: dict[str, Any] | None = None,
-    ) -> PlannerOutput:
-        """
-        Uses an LLM to generate or refine a plan, then validates and repairs it.
-        """
-        all_actions = self.agent_pool.get_all_action_definitions()
-        available_capabilities_json = json.dumps(all_actions, indent=2)
-
-        response_format = (
-            '{"thought": "...", "plan": [{"action": "...", "parameters": {}, '
-            '"assigned_persona": "..."}]}'
-        )
-        master_prompt: str
-
-        data_flow_instructions = """
+_DATA_FLOW_INSTRUCTIONS = """
 # WORKSPACE & DATA FLOW
 - The `orchestrator` maintains a temporary `workspace` for each goal.
 - When a tool is executed, its return value is added to the workspace. For example,
@@ -103,16 +34,12 @@ class Planner:
 - **DO NOT** use placeholders like `<<...>>` or `{{...}}`. Only use single curly braces: `{key}`.
 """
 
-        if refinement_feedback:
-            logging.critical(
-                "REFINING plan for goal: '%s' based on QA feedback.", goal_description
-            )
-            previous_plan_str = json.dumps(
-                refinement_feedback.get("plan_to_review", []), indent=2
-            )
-            feedback_str = refinement_feedback.get("feedback", "No feedback provided.")
+_DOCS_MODE_INSTRUCTION = (
+    'You are in "docs" mode. You MUST NOT use the "write_code" '
+    'or "execute_python_code" actions.'
+)
 
-            master_prompt = f"""
+_REFINE_TEMPLATE = """
 You are an expert project manager AGI. A plan you created was reviewed by your QA
 team and rejected. Your task is to incorporate their feedback to create a better plan.
 
@@ -137,9 +64,8 @@ team and rejected. Your task is to incorporate their feedback to create a better
     "action", "parameters", and "assigned_persona". Respond ONLY with the raw
     JSON object: {response_format}
 """
-        elif failure_context:
-            logging.critical("REPLANNING for goal: '%s'", goal_description)
-            master_prompt = f"""
+
+_REPLAN_TEMPLATE = """
 You are an expert troubleshooter AGI. A previous attempt to achieve a goal
 failed. Your task is to perform a root-cause analysis and create a new, corrected plan.
 
@@ -147,7 +73,7 @@ failed. Your task is to perform a root-cause analysis and create a new, correcte
 {goal_description}
 
 --- FAILED PLAN CONTEXT ---
-{json.dumps(failure_context, indent=2)}
+{failure_context}
 
 --- AVAILABLE CAPABILITIES (JSON) ---
 {available_capabilities_json}
@@ -164,18 +90,13 @@ failed. Your task is to perform a root-cause analysis and create a new, correcte
     "parameters", and "assigned_persona". Respond ONLY with the raw JSON
     object: {response_format}
 """
-        else:
-            logging.info("Decomposing goal: '%s'", goal_description)
-            docs_mode_instruction = (
-                'You are in "docs" mode. You MUST NOT use the "write_code" '
-                'or "execute_python_code" actions.'
-            )
-            master_prompt = f"""
+
+_DECOMPOSE_TEMPLATE = """
 You are a master project manager AGI. Your task is to decompose a high-level
 goal into a series of concrete, logical steps.
 
-# GOAL MODE: {mode.upper()}
-{docs_mode_instruction if mode == "docs" else ""}
+# GOAL MODE: {mode}
+{mode_instruction}
 
 # AVAILABLE CAPABILITIES (JSON format)
 {available_capabilities_json}
@@ -205,6 +126,145 @@ Goal: "{goal_description}"
     data between steps.
 3.  **Respond**: Format your entire response as a single JSON object: {response_format}
 """
+
+_INVALID_PLAN_FEEDBACK = (
+    "The generated plan contained invalid action/persona "
+    "assignments. Please regenerate the plan adhering "
+    "strictly to the available capabilities."
+)
+
+_JSON_REPAIR_TEMPLATE = """
+The following text is NOT valid JSON.
+--- BROKEN TEXT ---
+{plan_str}
+---
+FIX THIS. Respond ONLY with the corrected, raw JSON object in the format {response_format}.
+"""
+
+
+class Planner:
+    """
+    A dedicated class for creating and repairing plans for the AGI.
+    It uses an introspector to reason about goals and available capabilities.
+    """
+
+    def __init__(
+        self,
+        introspector: RecursiveIntrospector,
+        skill_manager: SkillManager,
+        agent_pool: DynamicAgentPool,
+        tool_plugin: ToolPlugin,
+    ):
+        self.introspector = introspector
+        self.skills = skill_manager
+        self.agent_pool = agent_pool
+        self.tools = tool_plugin
+        self._valid_actions: frozenset[str] | None = None
+        self._valid_actions_revision = -1
+
+    def _get_valid_actions(self) -> frozenset[str]:
+        """
+        Returns every action name a plan step may use: tool methods, learned skills
+        and innate actions. Rebuilt only when the skill set has changed.
+        """
+        if (
+            self._valid_actions is None
+            or self._valid_actions_revision != self.skills.revision
+        ):
+            self._valid_actions = frozenset(
+                {
+                    *dir(self.tools),
+                    *self.skills.skill_index,
+                    *self.skills.innate_actions_by_name,
+                }
+            )
+            self._valid_actions_revision = self.skills.revision
+        return self._valid_actions
+
+    async def _validate_and_repair_plan(
+        self, plan: list[dict[str, Any]], goal_description: str
+    ) -> list[dict[str, Any]]:
+        """
+        Validates that each step in a plan has a valid action for its assigned persona.
+        If not, it provides feedback for replanning.
+        """
+        invalid_steps: list[str] = []
+        valid_actions = self._get_valid_actions()
+
+        for i, step in enumerate(plan):
+            action = step.get("action")
+            persona = step.get("assigned_persona")
+            if not action or not persona:
+                invalid_steps.append(
+                    f"Step {i + 1} is missing 'action' or 'assigned_persona'."
+                )
+                continue
+
+            if action not in valid_actions:
+                invalid_steps.append(
+                    f"Step {i + 1}: Action '{action}' is not a valid action."
+                )
+
+        if invalid_steps:
+            feedback = "The generated plan is invalid. " + " ".join(invalid_steps)
+            logging.warning("[Planner] Invalid plan generated. Feedback: %s", feedback)
+            return []
+
+        return plan
+
+    def _build_master_prompt(
+        self,
+        goal_description: str,
+        mode: GoalMode,
+        available_capabilities_json: str,
+        failure_context: dict[str, Any] | None,
+        refinement_feedback: dict[str, Any] | None,
+    ) -> str:
+        """Builds the planning prompt for a fresh plan, a replan or a refinement."""
+        if refinement_feedback:
+            logging.critical(
+                "REFINING plan for goal: '%s' based on QA feedback.", goal_description
+            )
+            previous_plan_str = json.dumps(
+                refinement_feedback.get("plan_to_review", []), indent=2
+            )
+            feedback_str = refinement_feedback.get("feedback", "No feedback provided.")
+
+            return _REFINE_TEMPLATE.format(
+                goal_description=goal_description,
+                previous_plan_str=previous_plan_str,
+                feedback_str=feedback_str,
+                available_capabilities_json=available_capabilities_json,
+                data_flow_instructions=_DATA_FLOW_INSTRUCTIONS,
+                response_format=_RESPONSE_FORMAT,
+            )
+        elif failure_context:
+            logging.critical("REPLANNING for goal: '%s'", goal_description)
+            return _REPLAN_TEMPLATE.format(
+                goal_description=goal_description,
+                failure_context=json.dumps(failure_context, indent=2),
+                available_capabilities_json=available_capabilities_json,
+                data_flow_instructions=_DATA_FLOW_INSTRUCTIONS,
+                response_format=_RESPONSE_FORMAT,
+            )
+        else:
+            logging.info("Decomposing goal: '%s'", goal_description)
+            return _DECOMPOSE_TEMPLATE.format(
+                mode=mode.upper(),
+                mode_instruction=_DOCS_MODE_INSTRUCTION if mode == "docs" else "",
+                available_capabilities_json=available_capabilities_json,
+                data_flow_instructions=_DATA_FLOW_INSTRUCTIONS,
+                goal_description=goal_description,
+                response_format=_RESPONSE_FORMAT,
+            )
+
+    async def _request_planner_output(
+        self, master_prompt: str
+    ) -> dict[str, Any] | None:
+        """
+        Sends a planning prompt to the LLM and parses the JSON reply, asking once
+        for a repaired reply if it is malformed. Returns None if both fail.
+        """
         plan_str = ""
         planner_output_dict: dict[str, Any] | None = None
         for attempt in range(2):
@@ -216,19 +276,17 @@ Goal: "{goal_description}"
                         "Malformed JSON response detected. Attempting repair on: %s",
                         plan_str[:200],
                     )
-                    forceful_prompt = f"""
-The following text is NOT valid JSON.
---- BROKEN TEXT ---
-{plan_str}
----
-FIX THIS. Respond ONLY with the corrected, raw JSON object in the format {response_format}.
-"""
+                    forceful_prompt = _JSON_REPAIR_TEMPLATE.format(
+                        plan_str=plan_str, response_format=_RESPONSE_FORMAT
+                    )
                     plan_str = await self.introspector.llm_reflect(forceful_prompt)
 
-                if "```json" in plan_str:
-                    plan_str = plan_str.partition("```json")[2].partition("```")[0]
-
-                planner_output_dict = json.loads(plan_str)
+                # Parse the first JSON object in the reply, skipping any code
+                # fence or prose around it.
+                start = plan_str.find("{")
+                planner_output_dict, _ = _JSON_DECODER.raw_decode(
+                    plan_str, max(start, 0)
+                )
                 break
 
             except json.JSONDecodeError as e:
@@ -241,44 +299,61 @@ FIX THIS. Respond ONLY with the corrected, raw JSON object in the format {respon
                         e,
                         plan_str,
                     )
-                    return PlannerOutput(
-                        thought="Failed to generate a valid plan.", plan=[]
-                    )
+                    return None
 
-        if planner_output_dict is None:
-            return PlannerOutput(thought="Planner returned no output.", plan=[])
-
-        thought = planner_output_dict.get("thought", "No thought recorded.")
-        raw_plan_steps = cast("list[dict[str, Any]]", planner_output_dict.get("plan", []))
-
-        repaired_plan_steps = await self._validate_and_repair_plan(
-            raw_plan_steps, goal_description
-        )
-        if not repaired_plan_steps:
-            if refinement_feedback is None and failure_context is None:
-                return await self.decompose_goal_into_plan(
-                    goal_description,
-                    file_manifest,
-                    mode,
-                    refinement_feedback={
-                        "feedback": (
-                            "The generated plan contained invalid action/persona "
-                            "assignments. Please regenerate the plan adhering "
-                            "strictly to the available capabilities."
-                        )
-                    },
-                )
-            else:
-                logging.error(
-                    "Plan validation failed during refinement. Returning empty plan."
-                )
-                return PlannerOutput(
-                    thought="Plan validation failed during refinement.", plan=[]
-                )
+        return planner_output_dict
+
+    async def decompose_goal_into_plan(
+        self,
+        goal_description: str,
+        mode: GoalMode = "code",
+        failure_context: dict[str, Any] | None = None,
+        refinement_feedback: dict[str, Any] | None = None,
+    ) -> PlannerOutput:
+        """
+        Uses an LLM to generate or refine a plan, then validates and repairs it.
+        """
+        available_capabilities_json = self.agent_pool.get_all_action_definitions_json()
+
+        # An invalid first plan is regenerated once with feedback; refinements and
+        # replans get a single attempt.
+        max_attempts = 2 if refinement_feedback is None and failure_context is None else 1
+        thought = "No thought recorded."
+        repaired_plan_steps: list[dict[str, Any]] = []
+        for attempt in range(max_attempts):
+            if attempt > 0:
+                refinement_feedback = {"feedback": _INVALID_PLAN_FEEDBACK}
+
+            master_prompt = self._build_master_prompt(
+                goal_description,
+                mode,
+                available_capabilities_json,
+                failure_context,
+                refinement_feedback,
+            )
+            planner_output_dict = await self._request_planner_output(master_prompt)
+            if planner_output_dict is None:
+                return PlannerOutput(thought="Failed to generate a valid plan.", plan=[])
+
+            thought = planner_output_dict.get("thought", "No thought recorded.")
+            raw_plan_steps = cast(
+                "list[dict[str, Any]]", planner_output_dict.get("plan", [])
+            )
+            repaired_plan_steps = await self._validate_and_repair_plan(
+                raw_plan_steps, goal_description
+            )
+            if repaired_plan_steps:
+                break
+        else:
+            logging.error(
+                "Plan validation failed during refinement. Returning empty plan."
+            )
+            return PlannerOutput(
+                thought="Plan validation failed during refinement.", plan=[]
+            )
 
         try:
-            ActionStepListValidator = TypeAdapter(list[ActionStep])
-            validated_plan = ActionStepListValidator.validate_python(
+            validated_plan = ACTION_STEP_LIST_ADAPTER.validate_python(
                 repaired_plan_steps
             )
         except ValidationError as e:
@@ -298,7 +373,7 @@ FIX THIS. Respond ONLY with the corrected, raw JSON object in the format {respon
                 action="review_plan",
                 parameters={
                     "original_goal": goal_description,
-                    "plan_to_review": [step.model_dump() for step in validated_plan],
+                    "plan_to_review": ACTION_STEP_LIST_ADAPTER.dump_python(validated_plan),
                 },
                 assigned_persona="qa",
             )
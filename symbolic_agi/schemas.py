@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from secrets import token_hex
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 
 # --- CORE CONFIGURATION ---
 
@@ -52,9 +53,9 @@ class EmotionalState(BaseModel):
     frustration: float = 0.2
 
     def clamp(self) -> None:
-        for field in self.__class__.model_fields:
-            value = getattr(self, field)
-            setattr(self, field, max(0.0, min(1.0, value)))
+        for field_name in self.__class__.model_fields:
+            value = getattr(self, field_name)
+            setattr(self, field_name, max(0.0, min(1.0, value)))
 
 
 class ActionStep(BaseModel):
@@ -65,6 +66,13 @@ class ActionStep(BaseModel):
     assigned_persona: str
     risk: Literal["low", "medium", "high"] | None = "low"
 
+    # Cleared when the parameters are known to hold no workspace placeholders
+    _needs_resolve: bool = PrivateAttr(default=True)
+
+
+# Validates/serialises whole plans in a single pydantic-core call
+ACTION_STEP_LIST_ADAPTER: TypeAdapter[list[ActionStep]] = TypeAdapter(list[ActionStep])
+
 
 # --- NEW: Structured Action Definitions ---
 class ActionParameter(BaseModel):
@@ -104,9 +112,16 @@ class PlannerOutput(BaseModel):
     plan: list[ActionStep]
 
 
-class ExecutionStepRecord(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ExecutionStepRecord:
+    """
+    A completed step plus the workspace keys it added, changed or removed.
+    A plain slotted dataclass: one is created per executed step and never validated.
+    """
+
     step: ActionStep
-    workspace_after: dict[str, Any]
+    workspace_delta: dict[str, Any]
+    workspace_removed: list[str] = field(default_factory=list)
 
 
 class SkillModel(BaseModel):
@@ -143,6 +158,8 @@ class PerceptionEvent(BaseModel):
     timestamp: str = Field(
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
+    # Importance score cached by PerceptionProcessor; not part of the serialized event.
+    _importance: float | None = PrivateAttr(default=None)
 
 
 MemoryType = Literal[
@@ -168,6 +185,7 @@ MemoryType = Literal[
     "cross_agent_transfer",
     "perception",
     "skill_explanation",
+    "system_monitoring",
 ]
 
 
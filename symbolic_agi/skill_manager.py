@@ -1,22 +1,44 @@
 # symbolic_agi/skill_manager.py
 
 import asyncio
+import heapq
 import json
 import logging
 import inspect
-import os
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import shutil
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
 
-import aiosqlite
+from pydantic import TypeAdapter
 
 from . import config
-from .schemas import ActionDefinition, ActionParameter, ActionStep, SkillModel
+from .database import connect_db, enable_wal, ensure_db_dir, resolve_memory_db
+from .schemas import (
+    ACTION_STEP_LIST_ADAPTER,
+    ActionDefinition,
+    ActionParameter,
+    ActionStep,
+    MessageModel,
+    SkillModel,
+)
 
 if TYPE_CHECKING:
     from .message_bus import RedisMessageBus
 
 
 _innate_action_registry: List[ActionDefinition] = []
+_innate_actions_by_name: Dict[str, ActionDefinition] = {}
+
+_SKILL_LIST_ADAPTER: TypeAdapter[List[SkillModel]] = TypeAdapter(List[SkillModel])
+
+# Assembles the whole skills table as a single JSON array inside SQLite
+_SKILLS_AS_JSON_QUERY = """
+SELECT json_group_array(json_object(
+    'id', id, 'name', name, 'description', description,
+    'action_sequence', json(action_sequence), 'created_at', created_at,
+    'usage_count', usage_count, 'effectiveness_score', effectiveness_score,
+    'version', version
+)) FROM skills
+"""
 
 
 def register_innate_action(
@@ -48,6 +70,7 @@ def register_innate_action(
         setattr(func, "_innate_action_persona", persona)
         setattr(func, "_innate_action_def", action_def)
         _innate_action_registry.append(action_def)
+        _innate_actions_by_name[func_name] = action_def
         return func
 
     return decorator
@@ -63,23 +86,41 @@ class SkillManager:
     ):
         self._db_path = db_path
         self.skills: Dict[str, SkillModel] = {}
+        # Highest version of each skill by name, for O(1) dispatch lookups
+        self.skill_index: Dict[str, SkillModel] = {}
+        # Every stored version of each skill, by name
+        self._by_name: Dict[str, List[SkillModel]] = {}
+        # Bumped whenever the set of skills changes, so callers can invalidate caches
+        self.revision: int = 0
         self.innate_actions: List[ActionDefinition] = _innate_action_registry
+        self.innate_actions_by_name: Dict[str, ActionDefinition] = _innate_actions_by_name
         self.message_bus = message_bus
         self._save_lock = asyncio.Lock()
+        # Backing directory when a memory database was requested, removed on shutdown
+        self._temp_db_dir: Optional[str] = None
 
     @classmethod
     async def create(cls, db_path: str = config.DB_PATH, message_bus: Optional["RedisMessageBus"] = None) -> "SkillManager":
         """Asynchronous factory for creating a SkillManager instance."""
+        db_path, temp_db_dir = resolve_memory_db(db_path)
         instance = cls(db_path, message_bus)
+        instance._temp_db_dir = temp_db_dir
         await instance._init_db()
         await instance._load_skills()
         logging.info("[SkillManager] Initialized with %d skills", len(instance.skills))
         return instance
 
+    async def shutdown(self) -> None:
+        """Removes the temporary database backing a requested memory database."""
+        if self._temp_db_dir:
+            shutil.rmtree(self._temp_db_dir, ignore_errors=True)
+            self._temp_db_dir = None
+
     async def _init_db(self) -> None:
         """Initializes the database and tables if they don't exist."""
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        async with aiosqlite.connect(self._db_path) as db:
+        ensure_db_dir(self._db_path)
+        async with connect_db(self._db_path) as db:
+            await enable_wal(db)
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS skills (
@@ -99,31 +140,81 @@ class SkillManager:
 
     async def _load_skills(self) -> None:
         """Loads skills from the database."""
-        async with aiosqlite.connect(self._db_path) as db:
-            async with db.execute("SELECT * FROM skills") as cursor:
-                rows = await cursor.fetchall()
-                for row in rows:
-                    skill_dict = {
-                        "id": row[0], "name": row[1], "description": row[2],
-                        "action_sequence": json.loads(row[3]),
-                        "created_at": row[4], "usage_count": row[5],
-                        "effectiveness_score": row[6], "version": row[7]
-                    }
-                    self.skills[row[0]] = SkillModel.model_validate(skill_dict)
-
-    async def _save_skill(self, skill: SkillModel) -> None:
-        """Saves a single skill to the database."""
+        loaded_skills: List[SkillModel]
+        async with connect_db(self._db_path) as db:
+            if config.TRUST_SKILLS_DB:
+                # Stream rows so only one raw row is held at a time
+                loaded_skills = []
+                async with db.execute("SELECT * FROM skills") as cursor:
+                    async for row in cursor:
+                        loaded_skills.append(
+                            self._construct_trusted_skill(
+                                {
+                                    "id": row[0], "name": row[1], "description": row[2],
+                                    "action_sequence": json.loads(row[3]),
+                                    "created_at": row[4], "usage_count": row[5],
+                                    "effectiveness_score": row[6], "version": row[7]
+                                }
+                            )
+                        )
+            else:
+                # Parse and validate the whole table straight from JSON in one
+                # pydantic-core call, with no intermediate Python dicts
+                async with db.execute(_SKILLS_AS_JSON_QUERY) as cursor:
+                    row = await cursor.fetchone()
+                loaded_skills = _SKILL_LIST_ADAPTER.validate_json(
+                    row[0] if row and row[0] else "[]"
+                )
+
+        for skill in loaded_skills:
+            self.skills[skill.id] = skill
+            self._index_skill(skill)
+
+    @staticmethod
+    def _construct_trusted_skill(skill_dict: Dict[str, Any]) -> SkillModel:
+        """
+        Builds a SkillModel from a database row without validation. Rows are written by
+        _save_skill from already-validated models; malformed rows are still validated.
+        """
+        steps = skill_dict["action_sequence"]
+        if isinstance(steps, list) and all(isinstance(s, dict) for s in steps):
+            return SkillModel.model_construct(
+                **{
+                    **skill_dict,
+                    "action_sequence": [
+                        ActionStep.model_construct(**step) for step in steps
+                    ],
+                }
+            )
+        return SkillModel.model_validate(skill_dict)
+
+    def _index_skill(self, skill: SkillModel) -> None:
+        """Records a skill in the name indexes, tracking the newest version seen so far."""
+        self._by_name.setdefault(skill.name, []).append(skill)
+        current = self.skill_index.get(skill.name)
+        if current is None or skill.version > current.version:
+            self.skill_index[skill.name] = skill
+            self.revision += 1
+
+    async def _save_skill(
+        self, skill: SkillModel, pruned: Sequence[SkillModel] = ()
+    ) -> None:
+        """Saves a single skill and deletes pruned versions in one transaction."""
         async with self._save_lock:
-            async with aiosqlite.connect(self._db_path) as db:
+            async with connect_db(self._db_path) as db:
                 await db.execute(
                     "INSERT OR REPLACE INTO skills VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                     (
                         skill.id, skill.name, skill.description,
-                        json.dumps([s.model_dump() for s in skill.action_sequence]),
+                        ACTION_STEP_LIST_ADAPTER.dump_json(skill.action_sequence).decode(),
                         skill.created_at, skill.usage_count,
                         skill.effectiveness_score, skill.version
                     )
                 )
+                if pruned:
+                    await db.executemany(
+                        "DELETE FROM skills WHERE id = ?", [(s.id,) for s in pruned]
+                    )
                 await db.commit()
 
     async def add_new_skill(
@@ -132,9 +223,8 @@ class SkillManager:
         """
         Creates a new, versioned skill from a successful plan and saves it.
         """
-        versions_of_skill = [s for s in self.skills.values() if s.name == name]
-        highest_version = max([s.version for s in versions_of_skill], default=0)
-        new_version = highest_version + 1
+        latest_skill = self.skill_index.get(name)
+        new_version = (latest_skill.version if latest_skill else 0) + 1
         logging.info("Creating new skill '%s' version %d.", name, new_version)
 
         new_skill = SkillModel(
@@ -144,12 +234,11 @@ class SkillManager:
             version=new_version,
         )
         self.skills[new_skill.id] = new_skill
-        await self._save_skill(new_skill)
-        await self._prune_old_skill_versions(name)
+        self._index_skill(new_skill)
+        pruned = self._prune_old_skill_versions(name)
+        await self._save_skill(new_skill, pruned)
 
         if self.message_bus:
-            from .schemas import MessageModel
-
             await self.message_bus.broadcast(
                 MessageModel(
                     sender_id="SymbolicAGI_Orchestrator",
@@ -164,49 +253,50 @@ class SkillManager:
                 )
             )
 
-    async def _prune_old_skill_versions(self, skill_name: str, keep: int = 3) -> None:
-        """Keeps only the N most recent versions of a skill."""
-        versions_of_skill = [s for s in self.skills.values() if s.name == skill_name]
+    def _prune_old_skill_versions(
+        self, skill_name: str, keep: int = 3
+    ) -> List[SkillModel]:
+        """
+        Keeps only the N most recent versions of a skill in memory and returns the
+        pruned versions, which the caller deletes from the database.
+        """
+        versions_of_skill = self._by_name.get(skill_name, [])
         if len(versions_of_skill) <= keep:
-            return
-
-        versions_of_skill.sort(key=lambda s: s.version, reverse=True)
-        skills_to_prune = versions_of_skill[keep:]
-
-        if skills_to_prune:
-            async with self._save_lock:
-                async with aiosqlite.connect(self._db_path) as db:
-                    for skill in skills_to_prune:
-                        logging.warning(
-                            "Pruning old skill version: %s v%d (ID: %s)",
-                            skill.name,
-                            skill.version,
-                            skill.id,
-                        )
-                        await db.execute("DELETE FROM skills WHERE id = ?", (skill.id,))
-                        self.skills.pop(skill.id, None)
-                    await db.commit()
+            return []
+
+        keepers = heapq.nlargest(keep, versions_of_skill, key=lambda s: s.version)
+        keeper_ids = {s.id for s in keepers}
+        skills_to_prune = [s for s in versions_of_skill if s.id not in keeper_ids]
+
+        for skill in skills_to_prune:
+            logging.warning(
+                "Pruning old skill version: %s v%d (ID: %s)",
+                skill.name,
+                skill.version,
+                skill.id,
+            )
+            self.skills.pop(skill.id, None)
+        self._by_name[skill_name] = keepers
+        return skills_to_prune
 
     def get_skill_by_name(self, name: str) -> Optional[SkillModel]:
         """Finds the highest version of a skill by its unique name."""
-        versions_of_skill = [s for s in self.skills.values() if s.name == name]
-        if not versions_of_skill:
+        skill = self.skill_index.get(name)
+        if skill is None:
             return None
 
-        skill = max(versions_of_skill, key=lambda s: s.version)
-        action_names = [step.action for step in skill.action_sequence]
-        logging.info(
-            "[SkillManager] Retrieved skill '%s' with actions: %s",
-            name,
-            action_names,
-        )
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            action_names = [step.action for step in skill.action_sequence]
+            logging.info(
+                "[SkillManager] Retrieved skill '%s' with actions: %s",
+                name,
+                action_names,
+            )
         return skill
 
     def is_skill(self, action_name: str) -> bool:
         """Checks if a given action name corresponds to a learned skill."""
-        is_skill_result = any(
-            skill.name == action_name for skill in self.skills.values()
-        )
+        is_skill_result = action_name in self.skill_index
         logging.debug(
             "[SkillManager] Checking if '%s' is a skill: %s",
             action_name,
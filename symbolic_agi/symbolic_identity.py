@@ -3,13 +3,11 @@
 import asyncio
 import json
 import logging
-import os
 from datetime import datetime, timezone
 from typing import Any
 
-import aiosqlite
-
 from . import config
+from .database import connect_db, enable_wal, ensure_db_dir
 from .schemas import MemoryEntryModel
 from .symbolic_memory import SymbolicMemory
 
@@ -55,8 +53,9 @@ class SymbolicIdentity:
 
     async def _init_db(self) -> None:
         """Initializes the database and tables if they don't exist."""
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        async with aiosqlite.connect(self._db_path) as db:
+        ensure_db_dir(self._db_path)
+        async with connect_db(self._db_path) as db:
+            await enable_wal(db)
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS identity_profile (
@@ -69,7 +68,7 @@ class SymbolicIdentity:
 
     async def _load_profile(self) -> None:
         """Loads the persistent identity profile from the database."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with connect_db(self._db_path) as db:
             async with db.execute("SELECT key, value FROM identity_profile") as cursor:
                 rows = await cursor.fetchall()
                 profile_data = {row[0]: json.loads(row[1]) for row in rows}
@@ -84,7 +83,7 @@ class SymbolicIdentity:
                 "name": self.name,
                 "value_system": self.value_system,
             }
-            async with aiosqlite.connect(self._db_path) as db:
+            async with connect_db(self._db_path) as db:
                 await db.executemany(
                     "INSERT OR REPLACE INTO identity_profile VALUES (?, ?)",
                     [(k, json.dumps(v)) for k, v in profile_data.items()],
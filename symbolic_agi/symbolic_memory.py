@@ -1,19 +1,21 @@
 # symbolic_agi/symbolic_memory.py
 
 import asyncio
+import heapq
 import json
 import logging
 import os
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Set
 
-import aiosqlite
 import faiss
 import numpy as np
 from openai import APIConnectionError, AsyncOpenAI, OpenAIError, RateLimitError
 
 from . import config, metrics
 from .api_client import monitored_chat_completion, monitored_embedding_creation
+from .database import connect_db, enable_wal, ensure_db_dir, is_file_db
 from .schemas import MemoryEntryModel, MemoryType
 
 
@@ -27,7 +29,12 @@ class SymbolicMemory:
         self.client = client
         self._db_path = db_path
         self.memory_map: Dict[int, MemoryEntryModel] = {}
-        self.faiss_index_path = os.path.join(os.path.dirname(db_path), "symbolic_mem.index")
+        # The index sits next to the database file; memory DBs and URIs keep it in memory only
+        self.faiss_index_path: Optional[str] = (
+            os.path.join(os.path.dirname(db_path), "symbolic_mem.index")
+            if is_file_db(db_path)
+            else None
+        )
         self.faiss_index = self._load_faiss(self.faiss_index_path)
         self._embedding_buffer: List[MemoryEntryModel] = []
         self._embedding_batch_size: int = 10
@@ -69,8 +76,9 @@ class SymbolicMemory:
 
     async def _init_db_and_load(self) -> None:
         """Initializes the database and loads existing memories."""
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        async with aiosqlite.connect(self._db_path) as db:
+        ensure_db_dir(self._db_path)
+        async with connect_db(self._db_path) as db:
+            await enable_wal(db)
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS memories (
@@ -99,7 +107,7 @@ class SymbolicMemory:
     async def save(self) -> None:
         """Public method to flush the buffer and save the FAISS index."""
         await self._process_embedding_buffer()
-        if self.faiss_index.ntotal > 0:
+        if self.faiss_index.ntotal > 0 and self.faiss_index_path:
             faiss.write_index(self.faiss_index, self.faiss_index_path)
             logging.info("FAISS index saved to %s.", self.faiss_index_path)
 
@@ -107,10 +115,10 @@ class SymbolicMemory:
         """Public method to rebuild the FAISS index."""
         self._rebuild_faiss_index()
 
-    def _load_faiss(self: "SymbolicMemory", path: str) -> faiss.IndexIDMap:
+    def _load_faiss(self: "SymbolicMemory", path: Optional[str]) -> faiss.IndexIDMap:
         """Loads the FAISS index, ensuring it's an IndexIDMap."""
         index: faiss.Index
-        if os.path.exists(path):
+        if path and os.path.exists(path):
             try:
                 index = faiss.read_index(path)
                 if not isinstance(index, faiss.IndexIDMap):
@@ -143,7 +151,8 @@ class SymbolicMemory:
             new_index.add_with_ids(embedding_matrix, id_array)
 
         self.faiss_index = new_index
-        faiss.write_index(self.faiss_index, self.faiss_index_path)
+        if self.faiss_index_path:
+            faiss.write_index(self.faiss_index, self.faiss_index_path)
         logging.info(
             "FAISS index rebuilt successfully with %d vectors.", new_index.ntotal
         )
@@ -181,6 +190,22 @@ class SymbolicMemory:
         if len(self._embedding_buffer) >= self._embedding_batch_size:
             await self._process_embedding_buffer()
 
+    async def add_memories(
+        self: "SymbolicMemory", entries: List[MemoryEntryModel]
+    ) -> None:
+        """Adds several memory entries to the embedding buffer, flushing at most once."""
+        if not entries:
+            return
+        self._embedding_buffer.extend(entries)
+        logging.debug(
+            "%d memory entries added. Buffer size: %d",
+            len(entries),
+            len(self._embedding_buffer),
+        )
+
+        if len(self._embedding_buffer) >= self._embedding_batch_size:
+            await self._process_embedding_buffer()
+
     async def _process_embedding_buffer(self) -> None:
         """Processes all memory entries in the buffer to generate and store embeddings."""
         if not self._embedding_buffer:
@@ -207,7 +232,7 @@ class SymbolicMemory:
             new_vectors: List[np.ndarray] = []
             new_ids: List[int] = []
 
-            async with aiosqlite.connect(self._db_path) as db:
+            async with connect_db(self._db_path) as db:
                 for i, entry in enumerate(entries_to_process):
                     entry.embedding = embeddings[i].tolist()
                     cursor = await db.execute(
@@ -334,7 +359,7 @@ Respond with ONLY the summary text.
             await self.add_memory(consolidated_entry)
 
             # Remove old memories from DB and in-memory map
-            async with aiosqlite.connect(self._db_path) as db:
+            async with connect_db(self._db_path) as db:
                 await db.execute(f"DELETE FROM memories WHERE id IN ({','.join('?' for _ in db_ids_to_remove)})", list(db_ids_to_remove))
                 await db.commit()
 
@@ -360,6 +385,11 @@ Respond with ONLY the summary text.
         sorted_memories = sorted(self.memory_map.values(), key=lambda m: m.timestamp, reverse=True)
         return sorted_memories[:n]
 
+    def count_recent_by_type(self, n: int = 100) -> Dict[str, int]:
+        """Counts the n most recent memories by type without sorting the whole store."""
+        recent = heapq.nlargest(n, self.memory_map.values(), key=lambda m: m.timestamp)
+        return dict(Counter(m.type for m in recent))
+
     def get_total_memory_count(self) -> int:
         """Returns the total number of memories, including the buffer."""
         return len(self.memory_map) + len(self._embedding_buffer)
@@ -7,10 +7,12 @@ import io
 import json
 import logging
 import os
+import time
+from collections import deque
 from multiprocessing import Process, Queue
 from contextlib import redirect_stdout
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast, cast
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, TextIO, Tuple, cast, cast
 from urllib.parse import urlparse
 
 # Third-party imports
@@ -27,6 +29,7 @@ except ImportError:
 # First-party imports
 from . import config
 from .api_client import client, monitored_chat_completion
+from .robust_qa_agent import RobustQAAgent
 from .schemas import ActionStep, MemoryEntryModel
 from .skill_manager import register_innate_action
 
@@ -39,6 +42,30 @@ try:
 except ImportError:
     memory_profiler = None
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from .prometheus_monitoring import agi_metrics
+except ImportError:
+    agi_metrics = None
+
+try:
+    from .api_client import get_usage_report
+except ImportError:
+    get_usage_report = None
+
+# (source, metric, threshold, recommendation), checked in order by the monitoring dashboard
+_PERFORMANCE_RULES = (
+    ("session", "total_cost_usd", 1.0, "🔍 High API costs detected - consider optimizing prompt efficiency"),
+    ("session", "avg_tokens_per_request", 2000, "📝 High average tokens per request - consider shorter, more focused prompts"),
+    ("system", "cpu_usage_percent", 80, "⚡ High CPU usage - consider reducing concurrent operations"),
+    ("system", "memory_usage_percent", 85, "🧠 High memory usage - consider memory cleanup operations"),
+    ("session", "duration_minutes", 120, "⏰ Long session detected - consider periodic restarts for optimal performance"),  # 2 hours
+)
+
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
 
@@ -83,6 +110,39 @@ class ToolPlugin:
         self.agi = agi
         self.workspace_dir = os.path.abspath(config.WORKSPACE_DIR)
         os.makedirs(self.workspace_dir, exist_ok=True)
+        # Last successful dashboard result, keyed by its monotonic build time
+        self._dashboard_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._dashboard_lock = asyncio.Lock()
+        # Built once for the dashboard's QA section. No plan review goes through this
+        # private agent, so its report is a placeholder with zero counters.
+        self._qa_agent: Optional[RobustQAAgent] = None
+        # Disk usage and process count move slowly, so they are sampled less often
+        self._slow_system_stats: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Persisted dashboards wait here and are stored as one memory per flush interval
+        self._dashboard_history: Deque[Dict[str, Any]] = deque(maxlen=config.MONITORING_HISTORY_SIZE)
+        self._last_history_flush = time.monotonic()
+        # Opened on the first domain suggestion and kept open for appends
+        self._suggestions_file: Optional[TextIO] = None
+        if psutil is not None:
+            # Prime the CPU counter so the dashboard can read it without blocking
+            psutil.cpu_percent(interval=None)
+
+    async def shutdown(self) -> None:
+        """Stores buffered monitoring history and closes the domain suggestions log."""
+        # Errors are logged rather than raised so the controller's shutdown still runs
+        if self.agi.memory:
+            try:
+                await self.flush_monitoring_history()
+            except Exception as e:
+                logging.error("Failed to store monitoring history on shutdown: %s", e, exc_info=True)
+        if self._suggestions_file is not None:
+            try:
+                os.fsync(self._suggestions_file.fileno())
+            except OSError as e:
+                logging.error("Failed to sync domain suggestions log: %s", e)
+            finally:
+                self._suggestions_file.close()
+                self._suggestions_file = None
 
     # --- Browser Tools ---
     @register_innate_action(
@@ -270,14 +330,8 @@ Respond with ONLY the generated explanation text.
                 skill_name,
                 skill_description,
             )
-            file_manifest_result = await self.list_files()
-            file_manifest_list = cast(
-                List[str], file_manifest_result.get("files", [])
-            )
-            file_manifest = ", ".join(file_manifest_list)
-
             planner_output = await self.agi.planner.decompose_goal_into_plan(
-                goal_description=skill_description, file_manifest=file_manifest
+                goal_description=skill_description
             )
 
             new_plan = planner_output.plan
@@ -2075,10 +2129,12 @@ Respond with ONLY the direct answer to the query.
                     "status": "pending_review"
                 }
                 
-                await self.write_file(
-                    file_path="domain_suggestions.json",
-                    content=json.dumps(suggestion_entry, indent=2)
-                )
+                # One compact JSON object per line, so earlier suggestions are kept
+                if self._suggestions_file is None:
+                    safe_file_path = self._get_safe_path("domain_suggestions.jsonl", self.workspace_dir)
+                    self._suggestions_file = open(safe_file_path, "a", encoding="utf-8")
+                self._suggestions_file.write(json.dumps(suggestion_entry, separators=(",", ":")) + "\n")
+                self._suggestions_file.flush()
                 
                 return {
                     "status": "success",
@@ -2102,21 +2158,74 @@ Respond with ONLY the direct answer to the query.
     @register_innate_action(
         "orchestrator", "Displays comprehensive monitoring and resource usage metrics."
     )
-    async def show_monitoring_dashboard(self, **kwargs: Any) -> Dict[str, Any]:
+    async def show_monitoring_dashboard(
+        self, include_summary: bool = False, persist: bool = False, **kwargs: Any
+    ) -> Dict[str, Any]:
         """
         ADVANCED: Comprehensive monitoring dashboard showing system performance,
         resource usage, token consumption, and operational metrics.
+        Results are reused for MONITORING_DASHBOARD_TTL_SECONDS, and concurrent
+        callers wait for a single in-flight build. The text summary and the
+        monitoring memory are only produced when include_summary / persist are set.
         """
+        async with self._dashboard_lock:
+            cached = self._dashboard_cache
+            if cached and time.monotonic() - cached[0] < config.MONITORING_DASHBOARD_TTL_SECONDS:
+                result = dict(cached[1])
+            else:
+                result = await self._build_monitoring_dashboard()
+                if result["status"] != "success":
+                    return result
+                self._dashboard_cache = (time.monotonic(), result)
+                result = dict(result)
+
+        if not (include_summary or persist):
+            return result
+
+        try:
+            if include_summary:
+                result["summary"] = self._format_dashboard_summary(result["dashboard"])
+            if persist:
+                # Buffer for historical tracking; a cached dashboard is only recorded once
+                history = self._dashboard_history
+                if not history or history[-1] is not result["dashboard"]:
+                    history.append(result["dashboard"])
+                if time.monotonic() - self._last_history_flush >= config.MONITORING_FLUSH_INTERVAL_SECONDS:
+                    await self.flush_monitoring_history()
+        except Exception as e:
+            return {
+                "status": "failure",
+                "description": f"Monitoring dashboard failed: {e}"
+            }
+        return result
+
+    async def flush_monitoring_history(self) -> None:
+        """Stores all buffered dashboards as a single system_monitoring memory."""
+        self._last_history_flush = time.monotonic()
+        if not self._dashboard_history:
+            return
+        dashboards = list(self._dashboard_history)
+        self._dashboard_history.clear()
+        await self.agi.memory.add_memory(
+            MemoryEntryModel(
+                type="system_monitoring",
+                content={"dashboards": dashboards},
+                importance=0.7
+            )
+        )
+
+    async def _build_monitoring_dashboard(self) -> Dict[str, Any]:
+        """Collects every dashboard section."""
         try:
             # Get token usage from API client
-            from .api_client import get_usage_report
-            usage_report = get_usage_report()
+            if get_usage_report is not None:
+                usage_report = get_usage_report()
+            else:
+                usage_report = {"session_summary": {}, "token_breakdown": {}, "usage_by_role": {}}
             
             # Get Prometheus metrics if available
             prometheus_metrics = {}
-            try:
-                from .prometheus_monitoring import agi_metrics
-                
+            if agi_metrics is not None:
                 # Calculate some derived metrics
                 prometheus_metrics = {
                     "prometheus_available": True,
@@ -2124,48 +2233,41 @@ Respond with ONLY the direct answer to the query.
                     "uptime_seconds": time.time() - agi_metrics.start_time,
                     "tracking_status": "ACTIVE"
                 }
-            except ImportError:
+            else:
                 prometheus_metrics = {
                     "prometheus_available": False,
                     "note": "Install prometheus_client for advanced metrics"
                 }
             
-            # Get QA performance if available
+            # Placeholder QA report: the dashboard's own agent never reviews plans
             qa_metrics = {}
             try:
-                from .robust_qa_agent import RobustQAAgent
-                qa_agent = RobustQAAgent()
-                qa_metrics = qa_agent.get_performance_report()
+                if self._qa_agent is None:
+                    self._qa_agent = RobustQAAgent()
+                qa_metrics = self._qa_agent.get_performance_report()
             except Exception:
                 qa_metrics = {"status": "QA metrics unavailable"}
             
             # Get memory stats
             memory_stats = {}
             try:
-                memories = await self.agi.memory.get_recent_memories(n=100)
+                memory_types = self.agi.memory.count_recent_by_type(n=100)
                 memory_stats = {
-                    "total_recent_memories": len(memories),
-                    "memory_types": {}
+                    "total_recent_memories": sum(memory_types.values()),
+                    "memory_types": memory_types
                 }
-                for memory in memories:
-                    mem_type = memory.type
-                    memory_stats["memory_types"][mem_type] = memory_stats["memory_types"].get(mem_type, 0) + 1
             except Exception as e:
                 memory_stats = {"error": str(e)}
             
-            # Get system performance
-            import psutil
-            system_stats = {
-                "cpu_usage_percent": psutil.cpu_percent(interval=1),
-                "memory_usage_percent": psutil.virtual_memory().percent,
-                "disk_usage_percent": psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent,
-                "process_count": len(psutil.pids())
-            }
+            # Get system performance; the psutil reads are syscalls, so keep them off the loop
+            if psutil is not None:
+                system_stats = await asyncio.to_thread(self._collect_system_stats)
+            else:
+                system_stats = {"note": "Install psutil for system metrics"}
             
             # Get web access compliance
             web_compliance = {}
             try:
-                from . import config
                 web_compliance = {
                     "whitelisted_domains": len(config.ALLOWED_DOMAINS),
                     "robots_txt_compliance": "ENABLED",
@@ -2188,25 +2290,9 @@ Respond with ONLY the direct answer to the query.
                 "recommendations": self._generate_performance_recommendations(usage_report, system_stats)
             }
             
-            # Generate summary text
-            summary_text = self._format_dashboard_summary(dashboard)
-            
-            # Store dashboard as memory for historical tracking
-            await self.agi.memory.add_memory(
-                MemoryEntryModel(
-                    type="system_monitoring",
-                    content={
-                        "dashboard": dashboard,
-                        "performance_summary": summary_text
-                    },
-                    importance=0.7
-                )
-            )
-            
             return {
                 "status": "success",
                 "dashboard": dashboard,
-                "summary": summary_text,
                 "monitoring_status": "COMPREHENSIVE"
             }
             
@@ -2216,82 +2302,77 @@ Respond with ONLY the direct answer to the query.
                 "description": f"Monitoring dashboard failed: {e}"
             }
     
+    def _collect_system_stats(self) -> Dict[str, Any]:
+        """Reads host CPU, memory, disk and process counts in one blocking batch."""
+        now = time.monotonic()
+        slow = self._slow_system_stats
+        if slow is None or now - slow[0] >= config.MONITORING_SLOW_STATS_TTL_SECONDS:
+            slow = (now, {
+                "disk_usage_percent": psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent,
+                "process_count": len(psutil.pids())
+            })
+            self._slow_system_stats = slow
+        return {
+            "cpu_usage_percent": psutil.cpu_percent(interval=None),
+            "memory_usage_percent": psutil.virtual_memory().percent,
+            **slow[1]
+        }
+
     def _generate_performance_recommendations(self, usage_report: Dict[str, Any], 
                                            system_stats: Dict[str, Any]) -> List[str]:
         """Generate performance optimization recommendations"""
-        recommendations = []
-        
-        # Token usage recommendations
-        total_cost = usage_report["session_summary"].get("total_cost_usd", 0)
-        if total_cost > 1.0:
-            recommendations.append("🔍 High API costs detected - consider optimizing prompt efficiency")
-        
-        avg_tokens = usage_report["session_summary"].get("avg_tokens_per_request", 0)
-        if avg_tokens > 2000:
-            recommendations.append("📝 High average tokens per request - consider shorter, more focused prompts")
-        
-        # System performance recommendations
-        cpu_usage = system_stats.get("cpu_usage_percent", 0)
-        if cpu_usage > 80:
-            recommendations.append("⚡ High CPU usage - consider reducing concurrent operations")
-        
-        memory_usage = system_stats.get("memory_usage_percent", 0)
-        if memory_usage > 85:
-            recommendations.append("🧠 High memory usage - consider memory cleanup operations")
-        
-        # Session duration recommendations
-        duration = usage_report["session_summary"].get("duration_minutes", 0)
-        if duration > 120:  # 2 hours
-            recommendations.append("⏰ Long session detected - consider periodic restarts for optimal performance")
-        
-        if not recommendations:
-            recommendations.append("✅ System performance is optimal")
-        
-        return recommendations
+        sources = {"session": usage_report["session_summary"], "system": system_stats}
+        recommendations = [
+            message
+            for source, metric, threshold, message in _PERFORMANCE_RULES
+            if sources[source].get(metric, 0) > threshold
+        ]
+        return recommendations or ["✅ System performance is optimal"]
     
     def _format_dashboard_summary(self, dashboard: Dict[str, Any]) -> str:
         """Format dashboard data into readable summary"""
         session = dashboard["session_summary"]
         tokens = dashboard["token_breakdown"]
         system = dashboard["system_performance"]
-        
-        summary = f"""
-📊 AGI MONITORING DASHBOARD
-==========================
-
-🕒 Session Overview:
-  • Duration: {session.get('duration_minutes', 0):.1f} minutes
-  • Total Requests: {session.get('total_requests', 0)}
-  • Total Tokens: {session.get('total_tokens', 0):,}
-  • Total Cost: ${session.get('total_cost_usd', 0):.4f}
-
-🔢 Token Usage:
-  • Prompt Tokens: {tokens.get('prompt_tokens', 0):,} ({tokens.get('prompt_percentage', 0):.1f}%)
-  • Completion Tokens: {tokens.get('completion_tokens', 0):,}
-  • Avg per Request: {session.get('avg_tokens_per_request', 0):.1f}
-  • Rate: {session.get('tokens_per_minute', 0):.1f} tokens/min
-
-⚡ System Performance:
-  • CPU Usage: {system.get('cpu_usage_percent', 0):.1f}%
-  • Memory Usage: {system.get('memory_usage_percent', 0):.1f}%
-  • Disk Usage: {system.get('disk_usage_percent', 0):.1f}%
-
-🛡️ Compliance Status:
-  • Web Access: {dashboard['web_compliance'].get('ethical_browsing', 'Unknown')}
-  • Robots.txt: {dashboard['web_compliance'].get('robots_txt_compliance', 'Unknown')}
-  • Domains: {dashboard['web_compliance'].get('whitelisted_domains', 0)} whitelisted
-
-📈 Monitoring:
-  • Prometheus: {dashboard['prometheus_metrics'].get('prometheus_available', False)}
-  • QA Agent: {dashboard['qa_performance'].get('status', 'Unknown')}
-  • Memory Tracking: {len(dashboard['memory_statistics'])} metrics
-"""
-        
+        web = dashboard["web_compliance"]
+
+        lines = [
+            "📊 AGI MONITORING DASHBOARD",
+            "==========================",
+            "",
+            "🕒 Session Overview:",
+            f"  • Duration: {session.get('duration_minutes', 0):.1f} minutes",
+            f"  • Total Requests: {session.get('total_requests', 0)}",
+            f"  • Total Tokens: {session.get('total_tokens', 0):,}",
+            f"  • Total Cost: ${session.get('total_cost_usd', 0):.4f}",
+            "",
+            "🔢 Token Usage:",
+            f"  • Prompt Tokens: {tokens.get('prompt_tokens', 0):,} ({tokens.get('prompt_percentage', 0):.1f}%)",
+            f"  • Completion Tokens: {tokens.get('completion_tokens', 0):,}",
+            f"  • Avg per Request: {session.get('avg_tokens_per_request', 0):.1f}",
+            f"  • Rate: {session.get('tokens_per_minute', 0):.1f} tokens/min",
+            "",
+            "⚡ System Performance:",
+            f"  • CPU Usage: {system.get('cpu_usage_percent', 0):.1f}%",
+            f"  • Memory Usage: {system.get('memory_usage_percent', 0):.1f}%",
+            f"  • Disk Usage: {system.get('disk_usage_percent', 0):.1f}%",
+            "",
+            "🛡️ Compliance Status:",
+            f"  • Web Access: {web.get('ethical_browsing', 'Unknown')}",
+            f"  • Robots.txt: {web.get('robots_txt_compliance', 'Unknown')}",
+            f"  • Domains: {web.get('whitelisted_domains', 0)} whitelisted",
+            "",
+            "📈 Monitoring:",
+            f"  • Prometheus: {dashboard['prometheus_metrics'].get('prometheus_available', False)}",
+            f"  • QA Agent: {dashboard['qa_performance'].get('status', 'Unknown')}",
+            f"  • Memory Tracking: {len(dashboard['memory_statistics'])} metrics",
+        ]
+
         # Add recommendations
         recommendations = dashboard.get("recommendations", [])
         if recommendations:
-            summary += "\n🎯 Recommendations:\n"
-            for rec in recommendations:
-                summary += f"  • {rec}\n"
-        
-        return summary.strip()
\ No newline at end of file
+            lines.append("")
+            lines.append("🎯 Recommendations:")
+            lines.extend(f"  • {rec}" for rec in recommendations)
+
+        return "\n".join(lines)
@@ -0,0 +1,50 @@
+from symbolic_agi.consciousness import Consciousness
+
+SUMMARIES = ["Woke up", "Read the workspace", "Finished a goal"]
+
+
+def stored_events(consciousness):
+    return sorted((e.summary, e.importance) for e in consciousness.life_story)
+
+
+async def test_save_state_batch_persists_all_events_in_one_save(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "batched.db")
+    consciousness = await Consciousness.create(db_path=db_path)
+
+    saves = 0
+    save_state = consciousness._save_state
+
+    async def counting_save_state():
+        nonlocal saves
+        saves += 1
+        await save_state()
+
+    monkeypatch.setattr(consciousness, "_save_state", counting_save_state)
+    events = await consciousness.save_state_batch(SUMMARIES, importance=0.8)
+
+    assert saves == 1
+    assert [e.summary for e in events] == SUMMARIES
+    reloaded = await Consciousness.create(db_path=db_path)
+    assert stored_events(reloaded) == sorted((s, 0.8) for s in SUMMARIES)
+    assert reloaded.drives == consciousness.drives
+
+
+async def test_save_state_batch_matches_per_event_saves(tmp_path):
+    batched = await Consciousness.create(db_path=str(tmp_path / "batched.db"))
+    await batched.save_state_batch(SUMMARIES, importance=0.8)
+
+    one_by_one = await Consciousness.create(db_path=str(tmp_path / "one_by_one.db"))
+    for summary in SUMMARIES:
+        one_by_one.add_life_event(summary, importance=0.8)
+        await one_by_one._save_state()
+
+    reloaded_batched = await Consciousness.create(db_path=str(tmp_path / "batched.db"))
+    reloaded_one_by_one = await Consciousness.create(db_path=str(tmp_path / "one_by_one.db"))
+    assert stored_events(reloaded_batched) == stored_events(reloaded_one_by_one)
+    assert reloaded_batched.drives == reloaded_one_by_one.drives
+
+
+async def test_memory_database_keeps_its_tables():
+    consciousness = await Consciousness.create(db_path=":memory:")
+    await consciousness.save_state_batch(SUMMARIES)
+    await consciousness.shutdown()
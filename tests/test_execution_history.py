@@ -0,0 +1,65 @@
+from collections import deque
+from types import SimpleNamespace
+
+from symbolic_agi.execution_unit import ExecutionUnit
+from symbolic_agi.schemas import ActionStep, GoalModel
+
+
+class FakeLTM:
+    def __init__(self, goal):
+        self.goal = goal
+
+    async def get_active_goal(self):
+        return self.goal
+
+    async def complete_sub_task(self, goal_id):
+        self.goal.sub_tasks.pop(0)
+
+    async def get_goal_by_id(self, goal_id):
+        return self.goal
+
+
+class ScriptedStrategy:
+    """Applies one workspace edit per executed step."""
+
+    def __init__(self, workspaces, edits):
+        self.workspaces = workspaces
+        self.edits = deque(edits)
+
+    async def execute_step(self, step, goal):
+        self.edits.popleft()(self.workspaces[goal.id])
+        return True
+
+
+async def test_reconstructed_workspace_matches_each_step():
+    edits = [
+        lambda ws: ws.update(summary="draft"),
+        lambda ws: ws.update(summary="final", notes=["a", "b"]),
+        lambda ws: ws.pop("summary"),
+        lambda ws: None,
+        lambda ws: ws.update(summary="restored"),
+    ]
+    # One step more than edits, so the goal never completes and triggers reflection
+    steps = [
+        ActionStep(action=f"step_{i}", parameters={}, assigned_persona="coder")
+        for i in range(len(edits) + 1)
+    ]
+    goal = GoalModel(description="Write a summary", sub_tasks=steps)
+    agi = SimpleNamespace(
+        perception_buffer=deque(),
+        ltm=FakeLTM(goal),
+        skills=SimpleNamespace(skill_index={}),
+        workspaces={},
+        execution_history={},
+    )
+    unit = ExecutionUnit(agi)
+    unit.execution_strategy = ScriptedStrategy(agi.workspaces, edits)
+
+    snapshots = []
+    for _ in edits:
+        await unit.handle_autonomous_cycle()
+        snapshots.append(dict(agi.workspaces[goal.id]))
+
+    assert len(agi.execution_history[goal.id]) == len(edits)
+    for index, expected in enumerate(snapshots):
+        assert unit.reconstruct_workspace_at(goal.id, index) == expected
@@ -0,0 +1,54 @@
+import time
+
+from symbolic_agi.plan_cache import PlanCache
+
+PLAN = [{"action": "read_file", "parameters": {"file_path": "notes.txt"}, "assigned_persona": "coder"}]
+
+
+async def make_cache(db_path, **kwargs):
+    cache = PlanCache(db_path=str(db_path), **kwargs)
+    await cache._init_db()
+    return cache
+
+
+async def test_put_then_get_hits(tmp_path):
+    cache = await make_cache(tmp_path / "agi.db")
+    await cache.put("Summarize the notes", PLAN)
+    # Fingerprints ignore case and whitespace differences
+    assert cache.get("  summarize   the NOTES ") == PLAN
+    assert cache.get("Write a poem") is None
+
+
+async def test_expired_entry_is_a_miss(tmp_path, monkeypatch):
+    cache = await make_cache(tmp_path / "agi.db", ttl_seconds=60)
+    await cache.put("Summarize the notes", PLAN)
+    later = time.time() + 61
+    monkeypatch.setattr("symbolic_agi.plan_cache.time.time", lambda: later)
+    assert cache.get("Summarize the notes") is None
+
+
+async def test_eviction_past_max_entries(tmp_path):
+    db_path = tmp_path / "agi.db"
+    cache = await make_cache(db_path, max_entries=2)
+    await cache.put("goal one", PLAN)
+    await cache.put("goal two", PLAN)
+    cache.get("goal one")  # goal two is now least recently used
+    await cache.put("goal three", PLAN)
+
+    assert cache.get("goal two") is None
+    assert cache.get("goal one") == PLAN
+    assert cache.get("goal three") == PLAN
+
+    # The evicted plan is deleted from SQLite as well
+    reloaded = await PlanCache.create(db_path=str(db_path))
+    assert reloaded.get("goal two") is None
+    assert reloaded.get("goal one") == PLAN
+
+
+async def test_create_reloads_saved_plans(tmp_path):
+    db_path = tmp_path / "agi.db"
+    cache = await PlanCache.create(db_path=str(db_path))
+    await cache.put("Summarize the notes", PLAN)
+
+    reloaded = await PlanCache.create(db_path=str(db_path))
+    assert reloaded.get("Summarize the notes") == PLAN
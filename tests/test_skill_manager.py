@@ -6,4 +6,9 @@ def test_initialization_type():
     The simplest possible test. Does creating a SkillManager object work?
     """
     manager = SkillManager(db_path=':memory:')
-    assert isinstance(manager, SkillManager)
\ No newline at end of file
+    assert isinstance(manager, SkillManager)
+
+async def test_create_with_memory_database():
+    manager = await SkillManager.create(db_path=':memory:')
+    assert manager.skills == {}
+    await manager.shutdown()